@@ -0,0 +1,46 @@
+"""
+Benchmarks model_builder on a deeply nested document (one dict per level) and on a wide
+document with about 100k nodes (values, dicts and lists):
+
+    python benchmarks/bench_builder.py [depth] [number of nodes]
+"""
+import sys
+import time
+
+from simple_model import model_builder
+
+
+def deep_document(depth: int) -> dict:
+    document = leaf = {}
+    for i in range(depth):
+        leaf['level'] = i
+        leaf['child'] = {}
+        leaf = leaf['child']
+    leaf['level'] = depth
+    return document
+
+
+def wide_document(nodes: int) -> dict:
+    # each item has 10 nodes: itself, 6 values, the tags list and its 2 values
+    return {
+        'items': [
+            {'id': i, 'name': 'item {}'.format(i), 'price': i / 10, 'active': True, 'stock': i % 7,
+             'sku': 'SKU-{}'.format(i), 'tags': ['a', 'b']}
+            for i in range(nodes // 10)
+        ],
+    }
+
+
+def bench(name: str, document: dict):
+    start = time.perf_counter()
+    model_builder(document)
+    print('{:<40} {:>8.3f}s'.format(name, time.perf_counter() - start))
+
+
+def main(depth: int = 1000, nodes: int = 100_000):
+    bench('{} levels deep document'.format(depth), deep_document(depth))
+    bench('{} nodes document'.format(nodes), wide_document(nodes))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
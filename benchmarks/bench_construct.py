@@ -0,0 +1,70 @@
+"""
+Compares rehydrating trusted records with Model.construct against the normal path, building
+models with Model(**values) and validating them:
+
+    python benchmarks/bench_construct.py [number of records]
+"""
+import sys
+import timeit
+from datetime import datetime
+from typing import List
+
+from simple_model import Model
+
+
+class Address(Model):
+    city: str
+    street: str
+
+
+class Customer(Model):
+    name: str
+    email: str
+    age: int
+    score: float
+    created_at: datetime
+    tags: List[str] = list
+    address: Address = None
+    active: bool = True
+
+    def validate_email(self, email):
+        assert '@' in email
+        return email
+
+
+def build(rows):
+    customers = [Customer(**row) for row in rows]
+    for customer in customers:
+        customer.validate()
+    return customers
+
+
+def construct(rows):
+    return [Customer.construct(**row) for row in rows]
+
+
+def main(size: int = 100_000):
+    address = Address(city='Recife', street='Rua da Aurora')
+    address.validate()
+    rows = [
+        {
+            'name': 'customer {}'.format(i),
+            'email': 'customer{}@example.com'.format(i),
+            'age': i % 90,
+            'score': i / 3,
+            'created_at': datetime(2019, 7, 4),
+            'tags': ['a', 'b'],
+            'address': address,
+        }
+        for i in range(size)
+    ]
+
+    for name, function in (('Model(**values) + validate()', build),
+                           ('Model.construct(**values)', construct),
+                           ('Model.construct_many(rows)', Customer.construct_many)):
+        elapsed = min(timeit.repeat(lambda: function(rows), number=1, repeat=3))
+        print('{:<30} {:>8.3f}s {:>10.0f} models/s'.format(name, elapsed, size / elapsed))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
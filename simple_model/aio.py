@@ -0,0 +1,101 @@
+"""
+Asynchronous building of models from async iterables of dicts (e.g. records read from
+asyncio streams or queues)
+"""
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from typing import AsyncIterable, AsyncIterator, Deque, List, Optional, Tuple, Type
+
+from .models import BaseModel
+
+
+def _build_batch(
+    model_class: Type[BaseModel], rows: List[dict], validate: bool,
+) -> Tuple[List[BaseModel], Optional[Exception]]:
+    """
+    Returns the models built from rows, or the models before the first invalid model and
+    its validation error
+    """
+    models = model_class._init_many(rows)
+    if not (validate and models):
+        return models, None
+
+    try:
+        model_class.validate_many(models)
+    except Exception:
+        # validate_many validates a field of all models at a time, so models are validated
+        # one at a time to find the first invalid one
+        for i, model in enumerate(models):
+            try:
+                model.validate()
+            except Exception as error:
+                return models[:i], error
+        raise
+
+    return models, None
+
+
+async def abuild(
+    model_class: Type[BaseModel], source: AsyncIterable[dict], concurrency: int = 4, max_pending: int = None,
+    batch_size: int = 100, executor: Executor = None, validate: bool = True,
+) -> AsyncIterator[BaseModel]:
+    """
+    Yields models built (and validated, unless validate is false) from the dicts of source,
+    in the same order. Dicts are built in batches of batch_size run on the executor (by
+    default the event loop executor), up to concurrency batches at a time.
+
+    At most max_pending dicts (by default concurrency * batch_size) are read from source
+    and not yielded yet: source is not read while the models are not consumed.
+    Validation errors are raised when the model failing validation would be yielded, after
+    yielding the models before it.
+    """
+    assert concurrency > 0 and batch_size > 0, 'concurrency and batch_size must be positive'
+    if max_pending is None:
+        max_pending = concurrency * batch_size
+    assert max_pending > 0, 'max_pending must be positive'
+
+    loop = asyncio.get_event_loop()
+    pending: Deque[asyncio.Future] = deque()  # batches in source order
+    pending_rows = 0
+    batch: List[dict] = []
+
+    def submit(rows: List[dict]):
+        nonlocal pending_rows
+        pending.append(loop.run_in_executor(executor, _build_batch, model_class, rows, validate))
+        pending_rows += len(rows)
+
+    async def next_batch() -> Tuple[List[BaseModel], Optional[Exception]]:
+        nonlocal pending_rows
+        models, error = await pending.popleft()
+        pending_rows -= len(models)
+        return models, error
+
+    try:
+        async for row in source:
+            batch.append(row)
+            if len(batch) < batch_size and pending_rows + len(batch) < max_pending:
+                continue
+
+            submit(batch)
+            batch = []
+            # batches are yielded once done or when too many are pending, so the source
+            # is not read until there's room for more rows
+            while pending and (pending[0].done() or len(pending) >= concurrency or pending_rows >= max_pending):
+                models, error = await next_batch()
+                for model in models:
+                    yield model
+                if error is not None:
+                    raise error
+
+        if batch:
+            submit(batch)
+        while pending:
+            models, error = await next_batch()
+            for model in models:
+                yield model
+            if error is not None:
+                raise error
+    finally:
+        for future in pending:
+            future.cancel()
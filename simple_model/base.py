@@ -1,6 +1,8 @@
+import threading
 import typing
+import weakref
 
-from .fields import ModelField, Unset
+from .fields import LazyNestedModelDescriptor, ModelField, Unset
 from .utils import is_not_special_object, is_private_attribute
 
 
@@ -37,12 +39,24 @@ class ModelMetaClass(type):
 
         new_class = super_new(cls, name, bases, attrs, **kwargs)
         meta = type('Meta', (), {})
+        options = getattr(new_class, 'Meta', None)
+        meta.frozen = getattr(options, 'frozen', False)
+        meta.intern = getattr(options, 'intern', False)
+        assert meta.frozen or not meta.intern, '{} model must be frozen to be interned'.format(name)
+        meta.intern_table = weakref.WeakValueDictionary() if meta.intern else None
+        meta.intern_lock = threading.Lock() if meta.intern else None
+        meta.lazy_nested = getattr(options, 'lazy_nested', False)
+        meta.strict = getattr(options, 'strict', False)
+        meta.primary_key = getattr(options, 'primary_key', None)
+        assert not (meta.frozen and meta.lazy_nested), '{} model cannot be frozen and lazy_nested'.format(name)
 
         hints = typing.get_type_hints(new_class)
         attrs = cls._get_class_attributes(new_class, parents)
         assert hints or attrs, '{} model must define class attributes'.format(new_class.__name__)
         meta.fields = cls._get_fields(attrs, hints)
         meta.descriptors = {}
+        lazy_fields = set()
+        meta.serialization_plans = {}  # (include, exclude) -> to_dict fields
 
         for field_name in meta.fields:
             field_type = hints.get(field_name) if hints else None
@@ -55,7 +69,25 @@ class ModelMetaClass(type):
             )
             meta.descriptors[field_name] = field
 
+            # nested models are kept as dicts until their first access
+            if meta.lazy_nested and isinstance(field_type, ModelMetaClass) and not field.is_property:
+                lazy_fields.add(field_name)
+                setattr(new_class, field_name, LazyNestedModelDescriptor(field))
+
+        assert meta.primary_key is None or meta.primary_key in meta.fields, (
+            '{} model primary key must be one of its fields'.format(name))
+        meta.lazy_fields = frozenset(lazy_fields)
+        meta.init_fields = tuple(
+            (field_name, field.default_value, field.default_value if callable(field.default_value) else None,
+             field.is_property)
+            for field_name, field in meta.descriptors.items()
+        )
+
         new_class._meta = meta
         new_class._is_valid = False
 
+        # only frozen models are hashable, unless the class defines its own __hash__
+        if '__hash__' not in vars(new_class):
+            new_class.__hash__ = new_class._hash if meta.frozen else None
+
         return new_class
@@ -0,0 +1,396 @@
+"""
+Compact binary encoding of models driven by their field annotations. Fields are encoded in
+name order, each value prefixed by a byte telling whether it is None:
+
+- bool, int and float values are packed with struct, ints out of the 64 bits range are
+  encoded as their length and bytes after a marker
+- str and bytes values are prefixed by their length
+- nested models, lists, tuples, sets and dicts are encoded recursively
+- date, time, datetime and Decimal values are encoded as strings and UUIDs as bytes
+- values of fields without a supported type (e.g. Any) are encoded with a type tag
+
+Encoded data starts with a header holding a fingerprint of the model schema, so data
+encoded by a different version of the model is not decoded by mistake.
+"""
+import mmap
+import struct
+import zlib
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Iterable, List, Tuple, Type, Union
+from uuid import UUID
+
+from .coercions import parse_date, parse_datetime, parse_time
+from .models import BaseModel
+
+MAGIC = b'SM\x01'
+
+_bool = struct.Struct('<?')
+_int = struct.Struct('<q')
+_float = struct.Struct('<d')
+_size = struct.Struct('<I')
+_header = struct.Struct('<3sI')
+
+# smallest int64, marks ints out of the int64 range (including itself) encoded by length
+_INT_MARKER = -2 ** 63
+
+
+class SchemaMismatch(ValueError):
+    pass
+
+
+# buffers values are decoded from, e.g. memory mapped files (see simple_model.store)
+_Buffer = Union[bytes, mmap.mmap]
+
+
+class _Codec:
+    """
+    Functions to encode values to a bytearray and decode them from bytes at an offset,
+    returning the decoded value and the offset after it
+    """
+
+    def __init__(self, encode: Callable[[bytearray, Any], None], decode: Callable[[_Buffer, int], Tuple[Any, int]],
+                 schema: str):
+        self.encode = encode
+        self.decode = decode
+        self.schema = schema
+
+
+def _struct_codec(struct_: struct.Struct, schema: str) -> _Codec:
+    pack, unpack_from, size = struct_.pack, struct_.unpack_from, struct_.size
+
+    def encode(buffer, value):
+        buffer += pack(value)
+
+    def decode(data, offset):
+        return unpack_from(data, offset)[0], offset + size
+
+    return _Codec(encode, decode, schema)
+
+
+def _int_codec() -> _Codec:
+    pack, unpack_from, size = _int.pack, _int.unpack_from, _int.size
+
+    def encode(buffer, value):
+        if _INT_MARKER < value < -_INT_MARKER:
+            buffer += pack(value)
+            return
+
+        data = value.to_bytes(value.bit_length() // 8 + 1, 'little', signed=True)
+        buffer += pack(_INT_MARKER)
+        buffer += _size.pack(len(data))
+        buffer += data
+
+    def decode(data, offset):
+        value = unpack_from(data, offset)[0]
+        offset += size
+        if value != _INT_MARKER:
+            return value, offset
+
+        length = _size.unpack_from(data, offset)[0]
+        offset += _size.size
+        return int.from_bytes(data[offset:offset + length], 'little', signed=True), offset + length
+
+    return _Codec(encode, decode, 'int')
+
+
+def _bytes_codec() -> _Codec:
+    pack, unpack_from = _size.pack, _size.unpack_from
+
+    def encode(buffer, value):
+        buffer += pack(len(value))
+        buffer += value
+
+    def decode(data, offset):
+        size = unpack_from(data, offset)[0]
+        offset += _size.size
+        return bytes(data[offset:offset + size]), offset + size
+
+    return _Codec(encode, decode, 'bytes')
+
+
+def _string_codec(to_str: Callable, from_str: Callable, schema: str) -> _Codec:
+    bytes_codec = _bytes_codec()
+
+    def encode(buffer, value):
+        bytes_codec.encode(buffer, to_str(value).encode())
+
+    def decode(data, offset):
+        value, offset = bytes_codec.decode(data, offset)
+        return from_str(value.decode()), offset
+
+    return _Codec(encode, decode, schema)
+
+
+def _uuid_codec() -> _Codec:
+    def encode(buffer, value):
+        buffer += value.bytes
+
+    def decode(data, offset):
+        return UUID(bytes=bytes(data[offset:offset + 16])), offset + 16
+
+    return _Codec(encode, decode, 'uuid')
+
+
+def _enum_codec(enum_class: type) -> _Codec:
+    value_codec = _any_codec()
+
+    def encode(buffer, value):
+        value_codec.encode(buffer, value.value)
+
+    def decode(data, offset):
+        value, offset = value_codec.decode(data, offset)
+        return enum_class(value), offset
+
+    return _Codec(encode, decode, 'enum:{}'.format(enum_class.__qualname__))
+
+
+def _sequence_codec(sequence_class: type, element_codec: _Codec) -> _Codec:
+    encode_element, decode_element = element_codec.encode, element_codec.decode
+
+    def encode(buffer, value):
+        buffer += _size.pack(len(value))
+        for elem in value:
+            encode_element(buffer, elem)
+
+    def decode(data, offset):
+        size = _size.unpack_from(data, offset)[0]
+        offset += _size.size
+        values = []
+        for _ in range(size):
+            elem, offset = decode_element(data, offset)
+            values.append(elem)
+        return sequence_class(values), offset
+
+    return _Codec(encode, decode, '{}[{}]'.format(sequence_class.__name__, element_codec.schema))
+
+
+def _fixed_tuple_codec(element_codecs: List[_Codec]) -> _Codec:
+    def encode(buffer, value):
+        for codec, elem in zip(element_codecs, value):
+            codec.encode(buffer, elem)
+
+    def decode(data, offset):
+        values = []
+        for codec in element_codecs:
+            elem, offset = codec.decode(data, offset)
+            values.append(elem)
+        return tuple(values), offset
+
+    return _Codec(encode, decode, 'tuple[{}]'.format(','.join(codec.schema for codec in element_codecs)))
+
+
+def _dict_codec(key_codec: _Codec, value_codec: _Codec) -> _Codec:
+    def encode(buffer, value):
+        buffer += _size.pack(len(value))
+        for key, elem in value.items():
+            key_codec.encode(buffer, key)
+            value_codec.encode(buffer, elem)
+
+    def decode(data, offset):
+        size = _size.unpack_from(data, offset)[0]
+        offset += _size.size
+        values = {}
+        for _ in range(size):
+            key, offset = key_codec.decode(data, offset)
+            values[key], offset = value_codec.decode(data, offset)
+        return values, offset
+
+    return _Codec(encode, decode, 'dict[{},{}]'.format(key_codec.schema, value_codec.schema))
+
+
+def _nullable(codec: _Codec) -> _Codec:
+    encode_value, decode_value = codec.encode, codec.decode
+
+    def encode(buffer, value):
+        if value is None:
+            buffer.append(0)
+        else:
+            buffer.append(1)
+            encode_value(buffer, value)
+
+    def decode(data, offset):
+        if not data[offset]:
+            return None, offset + 1
+        return decode_value(data, offset + 1)
+
+    return _Codec(encode, decode, codec.schema)
+
+
+def _any_codec() -> _Codec:
+    """
+    Codec of values of unknown types, prefixed by a tag telling their type
+    """
+    codecs: dict = {}  # tag -> codec
+
+    def encode(buffer, value):
+        if isinstance(value, BaseModel):
+            value = value.as_dict()
+
+        for tag, (types, codec) in codecs.items():
+            if isinstance(value, types):
+                buffer.append(tag)
+                codec.encode(buffer, value)
+                return
+
+        raise TypeError('Values of type {} cannot be encoded'.format(type(value)))
+
+    def decode(data, offset):
+        return codecs[data[offset]][1].decode(data, offset + 1)
+
+    codec = _Codec(encode, decode, 'any')
+    # bool must come before int as bools are ints
+    codecs.update({
+        0: (type(None), _Codec(lambda buffer, value: None, lambda data, offset: (None, offset), 'none')),
+        1: (bool, _struct_codec(_bool, 'bool')),
+        2: (int, _int_codec()),
+        3: (float, _struct_codec(_float, 'float')),
+        4: (str, _string_codec(str, str, 'str')),
+        5: ((bytes, bytearray), _bytes_codec()),
+        6: ((list, tuple, set, frozenset), _sequence_codec(list, codec)),
+        7: (dict, _dict_codec(codec, codec)),
+    })
+    return codec
+
+
+def _compile(type_) -> _Codec:
+    origin = getattr(type_, '__origin__', None)
+    args: Tuple[Any, ...] = getattr(type_, '__args__', None) or ()
+
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]  # noqa: E721
+        return _compile(members[0]) if len(members) == 1 else _nullable(_any_codec())
+
+    type_class = origin or type_
+    if not isinstance(type_class, type):
+        return _nullable(_any_codec())
+
+    if issubclass(type_class, BaseModel):
+        return _nullable(_get_model_codec(type_class))
+
+    if issubclass(type_class, bool):
+        codec = _struct_codec(_bool, 'bool')
+    elif issubclass(type_class, Enum):
+        codec = _enum_codec(type_class)
+    elif issubclass(type_class, int):
+        codec = _int_codec()
+    elif issubclass(type_class, float):
+        codec = _struct_codec(_float, 'float')
+    elif issubclass(type_class, str):
+        codec = _string_codec(str, str, 'str')
+    elif issubclass(type_class, bytes):
+        codec = _bytes_codec()
+    elif issubclass(type_class, datetime):
+        codec = _string_codec(datetime.isoformat, parse_datetime, 'datetime')
+    elif issubclass(type_class, date):
+        codec = _string_codec(date.isoformat, parse_date, 'date')
+    elif issubclass(type_class, time):
+        codec = _string_codec(time.isoformat, parse_time, 'time')
+    elif issubclass(type_class, Decimal):
+        codec = _string_codec(str, Decimal, 'decimal')
+    elif issubclass(type_class, UUID):
+        codec = _uuid_codec()
+    elif issubclass(type_class, tuple) and len(args) > 1 and args[1] is not Ellipsis:
+        codec = _fixed_tuple_codec([_compile(arg) for arg in args])
+    elif issubclass(type_class, (list, tuple, set, frozenset)):
+        sequence_class = next(cls for cls in (tuple, frozenset, set, list) if issubclass(type_class, cls))
+        codec = _sequence_codec(sequence_class, _compile(args[0]) if args else _nullable(_any_codec()))
+    elif issubclass(type_class, dict):
+        key_type, value_type = args if len(args) == 2 else (Any, Any)
+        codec = _dict_codec(_compile(key_type), _compile(value_type))
+    else:
+        return _nullable(_any_codec())
+
+    return _nullable(codec)
+
+
+def _get_model_codec(model_class: Type[BaseModel]) -> _Codec:
+    try:
+        return model_class._meta.binary_codec
+    except AttributeError:
+        pass
+
+    descriptors = model_class._meta.descriptors
+    field_names = sorted(name for name in model_class._meta.fields if not descriptors[name].is_property)
+    field_codecs: List[_Codec] = []
+
+    def encode(buffer, model):
+        for name, codec in zip(field_names, field_codecs):
+            codec.encode(buffer, getattr(model, name))
+
+    def decode(data, offset):
+        values = {}
+        for name, codec in zip(field_names, field_codecs):
+            values[name], offset = codec.decode(data, offset)
+
+        return model_class._construct(values), offset
+
+    # the codec is cached before compiling the fields, so models nested in themselves work
+    codec = model_class._meta.binary_codec = _Codec(encode, decode, model_class.__qualname__)
+    field_codecs.extend(_compile(descriptors[name]._type) for name in field_names)
+    codec.schema = '{}({})'.format(model_class.__qualname__, ','.join(
+        '{}:{}'.format(name, field_codec.schema) for name, field_codec in zip(field_names, field_codecs)))
+    model_class._meta.binary_fingerprint = zlib.crc32(codec.schema.encode())
+    return codec
+
+
+def _check_header(model_class: Type[BaseModel], data: bytes) -> int:
+    _get_model_codec(model_class)
+    magic, fingerprint = _header.unpack_from(data, 0)
+    if magic != MAGIC or fingerprint != model_class._meta.binary_fingerprint:
+        raise SchemaMismatch('Data was not encoded from the current {} schema'.format(model_class.__name__))
+    return _header.size
+
+
+def to_bytes(model: BaseModel) -> bytes:
+    """
+    Encodes the model to bytes
+    """
+    assert model._is_valid, 'model.validate() must be run before conversion'
+
+    codec = _get_model_codec(type(model))
+    buffer = bytearray(_header.pack(MAGIC, type(model)._meta.binary_fingerprint))
+    codec.encode(buffer, model)
+    return bytes(buffer)
+
+
+def from_bytes(model_class: Type[BaseModel], data: bytes) -> BaseModel:
+    """
+    Decodes a model encoded by to_bytes. Decoded models are valid, as only valid models
+    are encoded
+    """
+    offset = _check_header(model_class, data)
+    model, _ = model_class._meta.binary_codec.decode(data, offset)
+    return model
+
+
+def to_bytes_many(model_class: Type[BaseModel], models: Iterable[BaseModel]) -> bytes:
+    """
+    Encodes many models of the same class to bytes
+    """
+    codec = _get_model_codec(model_class)
+    models = list(models)
+    buffer = bytearray(_header.pack(MAGIC, model_class._meta.binary_fingerprint))
+    buffer += _size.pack(len(models))
+    for model in models:
+        assert type(model) is model_class, 'All models should be instances of {}'.format(model_class.__name__)
+        assert model._is_valid, 'model.validate() must be run before conversion'
+        codec.encode(buffer, model)
+    return bytes(buffer)
+
+
+def from_bytes_many(model_class: Type[BaseModel], data: bytes) -> List[BaseModel]:
+    """
+    Decodes models encoded by to_bytes_many
+    """
+    offset = _check_header(model_class, data)
+    decode = model_class._meta.binary_codec.decode
+    size = _size.unpack_from(data, offset)[0]
+    offset += _size.size
+
+    models = []
+    for _ in range(size):
+        model, offset = decode(data, offset)
+        models.append(model)
+    return models
@@ -1,22 +1,24 @@
-from typing import Any, Generator
+from typing import Any, Generator, Type
 
+from . import metrics
+from .identity import IdentityMap
 from .models import Model
 from .utils import camel_case, coerce_to_alpha, snake_case, remove_private_keys
 
 
-def model_class_builder(class_name: str, data: Any) -> type:
+def model_class_builder(class_name: str, data: Any) -> Type[Model]:
     keys = data.keys() or ('',)
     attrs = {key: None for key in keys}
     attrs['__annotations__'] = {key: Any for key in keys}  # type: ignore
     new_class = type(class_name, (Model,), remove_private_keys(attrs))
+    if metrics.enabled:
+        metrics.increment('builder_classes', class_name)
     return new_class
 
 
-def model_builder(
-    data: Any, class_name: str = 'MyModel', cls: type = None, recurse: bool = True,
-    snake_case_keys: bool = True, alpha_keys: bool = True,
+def _build_instance(
+    data: Any, class_name: str, cls: type = None, snake_case_keys: bool = True, alpha_keys: bool = True,
 ) -> Model:
-
     clean_funcs = []
     if snake_case_keys:
         clean_funcs.append(snake_case)
@@ -27,35 +29,55 @@ def model_builder(
     data = {func(key): value for key, value in data.items() for func in clean_funcs}
     if not cls:
         cls = model_class_builder(class_name, data)
-    instance = cls(**remove_private_keys(data))
+    return cls(**remove_private_keys(data))
+
 
+def model_builder(
+    data: Any, class_name: str = 'MyModel', cls: type = None, recurse: bool = True,
+    snake_case_keys: bool = True, alpha_keys: bool = True,
+) -> Model:
+
+    root = _build_instance(data, class_name, cls, snake_case_keys, alpha_keys)
     if not recurse:
-        return instance
+        return root
 
-    for name, descriptor in instance._get_fields():
-        value = getattr(instance, name)
-        if isinstance(value, dict):
-            value = model_builder(value, camel_case(name))
-        elif isinstance(value, (list, tuple)):
-            value = list(value)
+    # nested dicts are built with the default options, using a stack of the instances
+    # whose fields were not built yet instead of recursion, so deeply nested data does
+    # not reach the recursion limit
+    stack = [root]
+    while stack:
+        instance = stack.pop()
+        nested = []
+        for name, descriptor in instance._get_fields():
+            value = getattr(instance, name)
+            if isinstance(value, dict):
+                value = _build_instance(value, camel_case(name))
+                nested.append(value)
+            elif isinstance(value, (list, tuple)):
+                value = list(value)
 
-            for i, elem in enumerate(value):
-                if not isinstance(elem, dict):
-                    continue
-                value[i] = model_builder(elem, 'NamelessModel')
+                for i, elem in enumerate(value):
+                    if not isinstance(elem, dict):
+                        continue
+                    value[i] = _build_instance(elem, 'NamelessModel')
+                    nested.append(value[i])
 
-            field_class = value.__class__
-            value = field_class(value)
+            setattr(instance, name, value)
 
-        setattr(instance, name, value)
+        stack.extend(reversed(nested))
 
-    return instance
+    return root
 
 
 def model_many_builder(
-    data: list, class_name: str = 'MyModel', cls: type = None, recurse: bool = True,
-    snake_case_keys: bool = True, alpha_keys: bool = True,
+    data: list, class_name: str = 'MyModel', cls: Type[Model] = None, recurse: bool = True,
+    snake_case_keys: bool = True, alpha_keys: bool = True, identity_map: IdentityMap = None,
 ) -> Generator[Model, None, None]:
+    """
+    Yields models built from many dicts. If an identity map is given and cls declares a
+    primary key (Meta.primary_key), dicts with the same primary key and values yield the
+    same model, see simple_model.identity
+    """
 
     if len(data) == 0:
         return
@@ -63,12 +85,17 @@ def model_many_builder(
     first = data[0]
     cls = cls or model_class_builder(class_name, first)
     for element in data:
-        model = model_builder(
-            data=element,
-            class_name=class_name,
-            cls=cls,
-            recurse=recurse,
-            snake_case_keys=snake_case_keys,
-            alpha_keys=alpha_keys,
-        )
-        yield model
+        def build(element=element):
+            return model_builder(
+                data=element,
+                class_name=class_name,
+                cls=cls,
+                recurse=recurse,
+                snake_case_keys=snake_case_keys,
+                alpha_keys=alpha_keys,
+            )
+
+        if identity_map is not None and cls._meta.primary_key is not None:
+            yield identity_map.resolve(cls, element, build)
+        else:
+            yield build()
@@ -0,0 +1,216 @@
+"""
+Generates the source of a Python module of Model classes inferred from sample documents,
+with the field types found on the samples (nested dicts become nested model classes):
+
+    python -m simple_model.codegen samples.json --class-name Customer --output models.py
+
+Sample files hold a JSON object or an array of JSON objects. Keys are cleaned as done by
+model_builder (see --no-snake-case-keys and --no-alpha-keys), so the generated models
+replace the ones inferred at runtime by model_builder.
+"""
+import argparse
+import json
+import keyword
+import re
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .utils import camel_case, coerce_to_alpha, snake_case
+
+SCALAR_TYPES = (bool, int, float, str)
+
+
+class _Field:
+    """
+    Types of the values found for a field (or for the elements of a list field)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.types: set = set()
+        self.nullable = False  # None or empty values are not valid unless the field is optional
+        self.count = 0
+        self.model: Optional[_ModelClass] = None
+        self.element: Optional[_Field] = None
+
+    def add(self, value: Any, generator: '_Generator'):
+        if value is None or (isinstance(value, (str, dict, list, tuple)) and not value):
+            self.nullable = True
+
+        if value is None:
+            return
+
+        if isinstance(value, SCALAR_TYPES):
+            self.types.add(type(value))
+        elif isinstance(value, dict):
+            self.types.add(dict)
+            if self.model is None:
+                self.model = generator.new_model(camel_case(self.name))
+            self.model.add(value, generator)
+        elif isinstance(value, (list, tuple)):
+            self.types.add(list)
+            if self.element is None:
+                self.element = _Field(self.name)
+            for elem in value:
+                self.element.add(elem, generator)
+        else:
+            self.types.add(object)
+
+    def annotation(self) -> str:
+        types = self.types
+        if types == {int, float}:
+            types = {float}
+
+        if len(types) != 1:  # no values but None or values of many types
+            return 'Any'
+
+        type_, = types
+        if type_ is dict and self.model is not None:
+            return self.model.name if self.model.fields else 'dict'
+        if type_ is list and self.element is not None:
+            return 'List[{}]'.format(self.element.annotation())
+        return type_.__name__ if type_ is not object else 'Any'
+
+
+class _ModelClass:
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.fields: Dict[str, _Field] = OrderedDict()
+
+    def add(self, document: dict, generator: '_Generator'):
+        self.count += 1
+        for key, value in document.items():
+            if key.startswith('__'):
+                continue
+
+            name = generator.clean_key(key)
+            field = self.fields.get(name)
+            if field is None:
+                field = self.fields[name] = _Field(name)
+            field.count += 1
+            field.add(value, generator)
+
+    def source(self) -> List[str]:
+        lines = ['class {}(Model):'.format(self.name)]
+        for name, field in self.fields.items():
+            annotation = field.annotation()
+            if annotation == 'Any':
+                lines.append('    {}: Any = None'.format(name))
+            elif field.nullable or field.count < self.count:  # empty or missing on some samples
+                lines.append('    {}: Optional[{}] = None'.format(name, annotation))
+            else:
+                lines.append('    {}: {}'.format(name, annotation))
+        return lines
+
+
+class _Generator:
+    def __init__(self, snake_case_keys: bool, alpha_keys: bool):
+        self.snake_case_keys = snake_case_keys
+        self.alpha_keys = alpha_keys
+        self.names = {'Any', 'List', 'Model', 'Optional'}
+
+    def clean_key(self, key: str) -> str:
+        if self.snake_case_keys:
+            key = snake_case(key)
+        if self.alpha_keys:
+            key = coerce_to_alpha(key)
+
+        if not key.isidentifier() or keyword.iskeyword(key):
+            raise ValueError('{!r} is not a valid field name'.format(key))
+        return key
+
+    def new_model(self, name: str) -> _ModelClass:
+        unique_name, suffix = name, 1
+        while unique_name in self.names:
+            suffix += 1
+            unique_name = '{}{}'.format(name, suffix)
+
+        self.names.add(unique_name)
+        return _ModelClass(unique_name)
+
+    def _nested_models(self, model: _ModelClass) -> Iterable[_ModelClass]:
+        for model_field in model.fields.values():
+            field: Optional[_Field] = model_field
+            while field is not None:
+                if field.model is not None:
+                    yield field.model
+                field = field.element
+
+    def source(self, root: _ModelClass) -> str:
+        # nested classes are defined before the classes using them
+        classes: List[_ModelClass] = []
+        stack = [(root, False)]
+        while stack:
+            model, visited = stack.pop()
+            if visited:
+                classes.append(model)
+                continue
+
+            stack.append((model, True))
+            stack.extend((nested, False) for nested in reversed(list(self._nested_models(model))))
+
+        body = '\n\n\n'.join('\n'.join(model.source()) for model in classes if model.fields)
+        typing_names = [name for name in ('Any', 'List', 'Optional') if re.search(r'\b{}\b'.format(name), body)]
+
+        header = ['"""', 'Models generated by simple_model.codegen', '"""']
+        if typing_names:
+            header.append('from typing import {}'.format(', '.join(typing_names)))
+            header.append('')
+        header.append('from simple_model import Model')
+        return '\n'.join(header) + '\n\n\n' + body + '\n'
+
+
+def generate_source(
+    samples: Union[dict, Iterable[dict]], class_name: str = 'MyModel',
+    snake_case_keys: bool = True, alpha_keys: bool = True,
+) -> str:
+    """
+    Returns the source of a module defining the model class_name (and its nested models)
+    inferred from one or many sample documents. Fields missing, None or empty on any sample
+    are optional and fields with values of different types are typed as Any
+    """
+    if isinstance(samples, dict):
+        samples = [samples]
+
+    generator = _Generator(snake_case_keys, alpha_keys)
+    root = generator.new_model(class_name)
+    for sample in samples:
+        assert isinstance(sample, dict), 'Samples must be dicts, not {}'.format(type(sample).__name__)
+        root.add(sample, generator)
+
+    assert root.fields, 'Samples must have at least one key'
+    return generator.source(root)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(
+        prog='python -m simple_model.codegen',
+        description='Generates a module of models inferred from sample JSON documents',
+    )
+    parser.add_argument('samples', nargs='+', help='JSON files with an object or an array of objects')
+    parser.add_argument('--class-name', default='MyModel', help='name of the root model class')
+    parser.add_argument('--output', '-o', help='module path (default: standard output)')
+    parser.add_argument('--no-snake-case-keys', dest='snake_case_keys', action='store_false')
+    parser.add_argument('--no-alpha-keys', dest='alpha_keys', action='store_false')
+    args = parser.parse_args(argv)
+
+    samples: List[dict] = []
+    for path in args.samples:
+        with open(path) as fileobj:
+            data = json.load(fileobj)
+        samples.extend(data if isinstance(data, list) else [data])
+
+    source = generate_source(
+        samples, class_name=args.class_name, snake_case_keys=args.snake_case_keys, alpha_keys=args.alpha_keys,
+    )
+    if args.output:
+        with open(args.output, 'w') as fileobj:
+            fileobj.write(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == '__main__':
+    main()
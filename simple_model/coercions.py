@@ -0,0 +1,99 @@
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Tuple
+from uuid import UUID
+
+_coercions: Dict[Tuple[type, type], Callable] = {}
+_coercions_cache: Dict[Tuple[type, type], Callable] = {}
+
+
+def register_coercion(source: type, target: type, coercion: Callable[[Any], Any]):
+    """
+    Registers the function used to convert values of type source (and its subclasses) on
+    fields of type target
+    """
+    _coercions[source, target] = coercion
+    _coercions_cache.clear()
+
+
+def get_coercion(source: type, target: type) -> Callable[[Any], Any]:
+    """
+    Returns the function used to convert values of type source on fields of type target.
+    Fields are converted by calling their type if there's no coercion registered
+    """
+    key = (source, target)
+    try:
+        return _coercions_cache[key]
+    except KeyError:
+        pass
+
+    coercion = next((_coercions[cls, target] for cls in source.__mro__ if (cls, target) in _coercions), target)
+    _coercions_cache[key] = coercion
+    return coercion
+
+
+# ISO 8601 formats written by isoformat() (date.fromisoformat and friends need python 3.7)
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})$')
+_TIME_RE = re.compile(
+    r'(\d{2})(?::(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?'
+    r'(?:([Zz])|([+-])(\d{2}):?(\d{2})(?::?(\d{2}))?)?$'
+)
+
+
+def parse_date(value: str) -> date:
+    match = _DATE_RE.match(value)
+    if not match:
+        raise ValueError('Invalid isoformat string: {!r}'.format(value))
+    return date(*map(int, match.groups()))
+
+
+def parse_time(value: str) -> time:
+    match = _TIME_RE.match(value)
+    if not match:
+        raise ValueError('Invalid isoformat string: {!r}'.format(value))
+
+    hour, minute, second, fraction, utc, sign, tz_hours, tz_minutes, tz_seconds = match.groups()
+    tzinfo = None
+    if utc:
+        tzinfo = timezone.utc
+    elif sign:
+        offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes), seconds=int(tz_seconds or 0))
+        tzinfo = timezone(-offset if sign == '-' else offset) if offset else timezone.utc
+
+    return time(
+        int(hour), int(minute or 0), int(second or 0), int((fraction or '0').ljust(6, '0')), tzinfo=tzinfo,
+    )
+
+
+def parse_datetime(value: str) -> datetime:
+    day = parse_date(value[:10])
+    if len(value) == 10:
+        return datetime.combine(day, time())
+
+    if len(value) < 12:
+        raise ValueError('Invalid isoformat string: {!r}'.format(value))
+    return datetime.combine(day, parse_time(value[11:]))
+
+
+def _float_to_decimal(value: float) -> Decimal:
+    return Decimal(repr(value))
+
+
+def _bytes_to_uuid(value: bytes) -> UUID:
+    return UUID(bytes=value)
+
+
+def _int_to_uuid(value: int) -> UUID:
+    return UUID(int=value)
+
+
+register_coercion(str, datetime, parse_datetime)
+register_coercion(str, date, parse_date)
+register_coercion(str, time, parse_time)
+register_coercion(str, Decimal, Decimal)
+register_coercion(int, Decimal, Decimal)
+register_coercion(float, Decimal, _float_to_decimal)
+register_coercion(str, UUID, UUID)
+register_coercion(bytes, UUID, _bytes_to_uuid)
+register_coercion(int, UUID, _int_to_uuid)
@@ -0,0 +1,67 @@
+"""
+Conversion of sequences of models to columns, i.e. a dict of the values of each field
+"""
+from array import array
+from operator import attrgetter
+from typing import Any, Dict, List, Mapping, Sequence, Type
+
+from .models import BaseModel
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # pragma: no cover
+    numpy = None
+
+ARRAY_TYPECODES = {bool: 'b', int: 'q', float: 'd'}
+NUMPY_DTYPES = {bool: 'bool', int: 'int64', float: 'float64'}
+
+
+def _column(models: Sequence[BaseModel], name: str, type_: Any, use_numpy: bool):
+    values = map(attrgetter(name), models)
+    try:
+        if type_ in NUMPY_DTYPES and use_numpy and numpy is not None:
+            return numpy.fromiter(values, dtype=NUMPY_DTYPES[type_], count=len(models))
+
+        if type_ in ARRAY_TYPECODES:
+            return array(ARRAY_TYPECODES[type_], values)
+    except (OverflowError, TypeError, ValueError):  # e.g. None values
+        values = map(attrgetter(name), models)
+
+    return list(values)
+
+
+def _column_values(column: Any) -> list:
+    # bool arrays (without numpy) hold ints
+    if isinstance(column, array) and column.typecode == ARRAY_TYPECODES[bool]:
+        return list(map(bool, column))
+    return column.tolist() if hasattr(column, 'tolist') else column
+
+
+def to_columns(models: Sequence[BaseModel], fields: Sequence[str] = None, use_numpy: bool = True) -> Dict[str, Any]:
+    """
+    Returns the values of the given fields (all fields by default) of models of the same
+    class by field. Values of bool, int and float fields are returned as numpy arrays, if
+    numpy is installed and use_numpy is true, or as array.array. Other fields values are
+    returned as lists.
+    """
+    if not isinstance(models, (list, tuple)):
+        models = list(models)
+
+    if not models:
+        return {name: [] for name in fields or ()}
+
+    model_class = type(models[0])
+    fields = fields or model_class._meta.fields
+    return {
+        name: _column(models, name, model_class._meta.descriptors[name]._type, use_numpy)
+        for name in fields
+    }
+
+
+def from_columns(model_class: Type[BaseModel], columns: Mapping[str, Any]) -> List[BaseModel]:
+    """
+    Returns the models built from columns returned by to_columns. Models are not validated
+    """
+    names = list(columns)
+    values = [_column_values(column) for column in columns.values()]
+    return model_class._init_many(dict(zip(names, row)) for row in zip(*values))
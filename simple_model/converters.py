@@ -1,19 +1,140 @@
+import json
+from datetime import date, time
+from decimal import Decimal
 from enum import Enum
+from typing import AbstractSet, Optional
+from uuid import UUID
 
+from . import metrics
 from .models import BaseModel
+from .serializers import register_serializer, serialize
 
 
-def to_dict(model: BaseModel):
+def _split_paths(paths: Optional[AbstractSet[str]]):
+    """
+    Splits "__" separated field paths into the top level field names and the paths of each
+    nested field, e.g.: {'name', 'address__city'} -> {'name', 'address'}, {'address': {'city'}}
+    """
+    if paths is None:
+        return None, {}
+
+    names: set = set()
+    nested_paths: dict = {}
+    for path in paths:
+        name, _, nested_path = path.partition('__')
+        names.add(name)
+        if nested_path:
+            nested_paths.setdefault(name, set()).add(nested_path)
+
+    return names, nested_paths
+
+
+def _get_plan(model_class, include: Optional[AbstractSet[str]], exclude: Optional[AbstractSet[str]]):
+    key = (include, exclude)
+    try:
+        return model_class._meta.serialization_plans[key]
+    except KeyError:
+        pass
+
+    included, nested_include = _split_paths(include)
+    _, nested_exclude = _split_paths(exclude)
+
+    fields = []
+    for field_name in model_class._meta.fields:
+        if included is not None and field_name not in included:
+            continue
+
+        if exclude and field_name in exclude:
+            continue
+
+        # including the whole field takes precedence over including some of its fields
+        field_include = None if include and field_name in include else nested_include.get(field_name)
+        field_exclude = nested_exclude.get(field_name)
+        fields.append((
+            field_name,
+            model_class._meta.descriptors[field_name],
+            frozenset(field_include) if field_include else None,
+            frozenset(field_exclude) if field_exclude else None,
+        ))
+
+    plan = model_class._meta.serialization_plans[key] = tuple(fields)
+    return plan
+
+
+def _to_python(value, include, exclude):
+    if not value and not isinstance(value, Enum):
+        return value
+
+    if isinstance(value, BaseModel):
+        return to_dict(value, include=include, exclude=exclude)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_to_python(elem, include, exclude) for elem in value]
+
+    if isinstance(value, dict):
+        return {key: _to_python(elem, include, exclude) for key, elem in value.items()}
+
+    return serialize(value)
+
+
+def to_dict(model: BaseModel, include: AbstractSet[str] = None, exclude: AbstractSet[str] = None):
+    """
+    Converts the model to dict. Use include and exclude to choose which fields are converted,
+    nested fields are chosen using "__" separated paths, e.g.: include={'name', 'address__city'}
+    """
     if not isinstance(model, BaseModel):
         raise TypeError('First argument must be of class type simple_model.Model')
 
     assert model._is_valid, 'model.validate() must be run before conversion'
 
+    if metrics.enabled:
+        metrics.increment('serializations', type(model).__name__)
+
+    include = frozenset(include) if include is not None else None
+    exclude = frozenset(exclude) if exclude else None
+
     d = {}
-    for field_name, descriptor in model._get_fields():
+    for field_name, descriptor, field_include, field_exclude in _get_plan(type(model), include, exclude):
+        # lazy nested models not built yet are kept as they were received
+        deferred = field_name in model._meta.lazy_fields and model._is_deferred(field_name)
+        if deferred and field_include is None and field_exclude is None:
+            d[field_name] = model.__dict__[field_name]
+            continue
+
         value = getattr(model, field_name)
-        if isinstance(value, Enum):
-            value = value.value
-        d[field_name] = descriptor.to_python(value)
+        if field_include is None and field_exclude is None:
+            d[field_name] = descriptor.to_python(value)
+        else:
+            d[field_name] = _to_python(value, field_include, field_exclude)
 
     return d
+
+
+class ModelJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder for models and the field types not supported by the json module, e.g.:
+    json.dumps(model, cls=ModelJSONEncoder, include={'name', 'address__city'})
+    """
+
+    def __init__(self, *args, include: AbstractSet[str] = None, exclude: AbstractSet[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.include = include
+        self.exclude = exclude
+
+    def default(self, obj):
+        if isinstance(obj, BaseModel):
+            return to_dict(obj, include=self.include, exclude=self.exclude)
+
+        if isinstance(obj, (date, time)):
+            return obj.isoformat()
+
+        if isinstance(obj, (Decimal, UUID)):
+            return str(obj)
+
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+
+        return super().default(obj)
+
+
+register_serializer(BaseModel, to_dict)
@@ -0,0 +1,172 @@
+"""
+Streaming CSV import and export of flat models. The CSV header is mapped to the model
+fields once and each column gets a converter compiled from its field annotation:
+
+- str columns are kept as read
+- bool columns accept true/false, yes/no, t/f, y/n and 1/0 (case insensitive)
+- enum columns hold the values of the enum members, converted to the members value type
+- other columns are converted using the field type conversion (e.g. int, Decimal, date)
+
+Empty cells are read as missing values, so the fields default values are used. Fields
+of container or model types (e.g. List[str] or nested models) have no CSV encoding and
+raise TypeError when read or written.
+"""
+import csv
+from collections.abc import Collection
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from operator import attrgetter
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Sequence, Type, Union
+from uuid import UUID
+
+from .fields import ModelField
+from .models import BaseModel
+from .serializers import serialize
+
+TRUE_VALUES = frozenset(('true', 't', 'yes', 'y', '1'))
+FALSE_VALUES = frozenset(('false', 'f', 'no', 'n', '0'))
+
+# types written with str(), as done by csv.writer. Enums are written by value, even if they
+# are subclasses of these types (e.g. IntEnum)
+_PLAIN_TYPES = (str, int, float, Decimal, UUID, date, datetime, time)
+
+
+def _parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise ValueError('invalid boolean value: {!r}'.format(value))
+
+
+def _unwrap_optional(type_: Any) -> Any:
+    if getattr(type_, '__origin__', None) is Union:
+        members = [member for member in type_.__args__ if member is not type(None)]
+        if len(members) == 1:
+            return members[0]
+    return type_
+
+
+def _check_flat(descriptor: ModelField) -> None:
+    type_ = _unwrap_optional(descriptor._type)
+    type_class = getattr(type_, '__origin__', None) or type_
+    # on python 3.6 the origin of generics is the typing class (e.g. typing.List)
+    type_class = getattr(type_class, '__extra__', None) or type_class
+    if not isinstance(type_class, type) or issubclass(type_class, (str, bytes)):
+        return
+
+    if issubclass(type_class, (Collection, BaseModel)):
+        raise TypeError('Field {!r} of type {} cannot be read from or written to CSV'.format(
+            descriptor.name, descriptor._type))
+
+
+def _column_reader(descriptor: ModelField) -> Optional[Callable[[str], Any]]:
+    _check_flat(descriptor)
+    type_ = _unwrap_optional(descriptor._type)
+    if type_ is None or type_ is Any or type_ is str or descriptor.is_property:
+        return None
+
+    if type_ is bool:
+        return _parse_bool
+
+    if isinstance(type_, type) and issubclass(type_, Enum):
+        return _enum_reader(descriptor, type_)
+
+    converter = descriptor._get_converter(type_)
+    return lambda value: converter(None, value)
+
+
+def _enum_reader(descriptor: ModelField, enum_class: Any) -> Callable[[str], Any]:
+    value_types = {type(member.value) for member in enum_class}
+    value_type = value_types.pop() if len(value_types) == 1 else str
+    if value_type is str:
+        return enum_class
+
+    if value_type is bool:
+        parse = _parse_bool
+    else:
+        converter = descriptor._get_converter(value_type)
+        parse = lambda value: converter(None, value)  # noqa: E731
+    return lambda value: enum_class(parse(value))
+
+
+def _column_writer(descriptor: ModelField) -> Optional[Callable[[Any], Any]]:
+    _check_flat(descriptor)
+    type_ = _unwrap_optional(descriptor._type)
+    if not isinstance(type_, type) or issubclass(type_, Enum):
+        return serialize
+    if type_ is bool or issubclass(type_, _PLAIN_TYPES):
+        return None
+    return serialize
+
+
+def iter_csv(model_class: Type[BaseModel], fileobj: IO[str], validate: bool = True,
+             **fmtparams) -> Iterator[BaseModel]:
+    """
+    Yields models of model_class read from a CSV file with a header row, one row at a time.
+    Columns not matching fields are ignored. Extra keyword arguments are passed to csv.reader
+    """
+    reader = csv.reader(fileobj, **fmtparams)
+    header = next(reader, None)
+    if header is None:
+        return
+
+    descriptors = model_class._meta.descriptors
+    columns = [
+        (position, name, _column_reader(descriptors[name]))
+        for position, name in enumerate(header)
+        if name in descriptors
+    ]
+
+    for row in reader:
+        values = {}
+        for position, name, read in columns:
+            value = row[position] if position < len(row) else ''
+            if value != '':
+                values[name] = read(value) if read else value
+
+        model = model_class._init(values)
+        if validate:
+            model.validate()
+        yield model
+
+
+def write_csv(model_class: Type[BaseModel], models: Iterable[BaseModel], fileobj: IO[str],
+              fields: Sequence[str] = None, **fmtparams) -> int:
+    """
+    Writes models of model_class to a CSV file with a header row, returning the number of
+    models written. By default all fields but properties are written, sorted by name.
+    Extra keyword arguments are passed to csv.writer
+    """
+    descriptors = model_class._meta.descriptors
+    if not fields:
+        fields = sorted(name for name, descriptor in descriptors.items() if not descriptor.is_property)
+
+    # unsupported fields are reported before anything is written
+    writers = [_column_writer(descriptors[name]) for name in fields]
+
+    writer = csv.writer(fileobj, **fmtparams)
+    writer.writerow(fields)
+
+    getter = attrgetter(*fields)
+    if len(fields) == 1:
+        get_row = lambda model: (getter(model),)  # noqa: E731
+    else:
+        get_row = getter
+
+    serialized = [(position, write) for position, write in enumerate(writers) if write]
+
+    count = 0
+    for model in models:
+        row = get_row(model)
+        if serialized:
+            values = list(row)
+            for position, write in serialized:
+                values[position] = write(values[position])
+            writer.writerow(values)
+        else:
+            writer.writerow(row)
+        count += 1
+    return count
@@ -8,3 +8,20 @@ class EmptyField(ValidationError):
 
     def __str__(self) -> str:
         return '{!r} field cannot be empty'.format(self.field_name)
+
+
+class StrictTypeError(ValidationError):
+    def __init__(self, field_name, field_type):
+        self.field_name = field_name
+        self.field_type = field_type
+
+    def __str__(self) -> str:
+        return '{!r} field value is not of type {!r}'.format(self.field_name, self.field_type)
+
+
+class FrozenInstanceError(AttributeError):
+    def __init__(self, field_name):
+        self.field_name = field_name
+
+    def __str__(self) -> str:
+        return 'cannot assign to field {!r} of a frozen model'.format(self.field_name)
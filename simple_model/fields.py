@@ -1,12 +1,30 @@
-from typing import Any, List, Union, Tuple, TypeVar
+from abc import ABCMeta
+from enum import Enum
+from typing import Any, TypeVar, Union
 
+from .coercions import get_coercion
 from .exceptions import EmptyField
-
-PARAMETRIZED_GENERICS = (List, Tuple)
+from .identity import active_identity_map
+from .serializers import serialize
 
 Unset = type('Unset', (), {})
 
 
+def _keep(instance, value):
+    return value
+
+
+def _any_type(value):
+    return True
+
+
+def _intern(value):
+    from .models import BaseModel
+    if isinstance(value, BaseModel) and value._meta.intern:
+        return value.intern()
+    return value
+
+
 class ModelField:
     def __init__(self, model_class, name, default_value=Unset, type=None):
         self.model_class = model_class
@@ -14,6 +32,9 @@ class ModelField:
         self._default_value = default_value
         self._type = type
         self.is_property = isinstance(getattr(model_class, name, None), property)
+        self._converters = {}  # type annotation -> compiled conversion function
+        self._union_dispatch = {}  # (union type, value type) -> union members in conversion order
+        self._checkers = {}  # type annotation -> compiled strict type check
 
         try:
             self._validate = getattr(model_class, 'validate_{}'.format(name))
@@ -46,101 +67,369 @@ class ModelField:
             return type_, None
 
     def convert_to_type(self, instance, value, field_class=None):
-        field_class = field_class or self._type
-        field_class, field_type = self._split_class_and_type(field_class)
-
-        if not field_class or field_class is Any or value is None or self.is_property:
+        if self.is_property:
             return value
 
-        if field_class is Union:
-            assert issubclass(type(value), field_type.__args__), (
-                'Field of type {} received an object of invalid type {}').format(
-                    field_type.__args__, type(value))
+        return self._get_converter(field_class or self._type)(instance, value)
 
-            return value
+    def _get_converter(self, type_):
+        try:
+            return self._converters[type_]
+        except KeyError:
+            converter = self._converters[type_] = self._compile(type_)
+            return converter
+
+    def check_type(self, value) -> bool:
+        """
+        Returns whether the value (and its elements, for containers) is exactly of the field
+        type, without converting it. Used on strict validation
+        """
+        return self.is_property or self._get_checker(self._type)(value)
+
+    def _get_checker(self, type_):
+        try:
+            return self._checkers[type_]
+        except KeyError:
+            checker = self._checkers[type_] = self._compile_check(type_)
+            return checker
+
+    def _compile_check(self, type_):
+        if not type_ or type_ is Any or isinstance(type_, TypeVar):
+            return _any_type
+
+        type_class, generic_type = self._split_class_and_type(type_)
+        if type_class is Union:
+            member_checks = [self._get_checker(member) for member in generic_type.__args__]
+            return lambda value: value is None or any(check(value) for check in member_checks)
+
+        if not isinstance(type_class, type):  # e.g. forward references
+            return _any_type
+
+        # on python 3.6 the origin of generics is the typing class (e.g. typing.List)
+        type_class = getattr(type_class, '__extra__', None) or type_class
+
+        # abstract types (e.g. Sequence) cannot be matched exactly
+        if isinstance(type_class, ABCMeta) and type_class.__abstractmethods__:
+            return lambda value: value is None or isinstance(value, type_class)
+
+        args = getattr(generic_type, '__args__', None) or ()
+        if type_class is tuple and len(args) > 1 and args[1] is not Ellipsis:
+            element_checks = [self._get_checker(arg) for arg in args]
+
+            def check_fixed_tuple(value):
+                if value is None:
+                    return True
+                if type(value) is not tuple or len(value) != len(element_checks):
+                    return False
+                return all(check(elem) for check, elem in zip(element_checks, value))
+
+            return check_fixed_tuple
+
+        if issubclass(type_class, (list, tuple, set, frozenset)) and args:
+            check_element = self._get_checker(args[0])
+            return lambda value: value is None or (
+                type(value) is type_class and all(check_element(elem) for elem in value))
+
+        if issubclass(type_class, dict) and len(args) == 2:
+            check_key, check_value = self._get_checker(args[0]), self._get_checker(args[1])
+            return lambda value: value is None or (
+                type(value) is type_class and all(check_key(k) and check_value(v) for k, v in value.items()))
+
+        return lambda value: value is None or type(value) is type_class
+
+    def _compile(self, type_):
+        """
+        Compiles the type annotation into a function that converts values to the annotated
+        type, e.g. Dict[str, List[Foo]] compiles to a function converting keys to str and
+        values to lists of Foo models
+        """
+        # if the type is a type var refrain from casting to avoid converting to a type
+        # the user may not want , e.g.
+        # T = TypeVar('T', str, bytes)
+        # class Model:
+        #    t: T
+        # what's the correct type to convert here? str? bytes? for now there's no conversion
+        if not type_ or type_ is Any or isinstance(type_, TypeVar):
+            return _keep
+
+        type_class, generic_type = self._split_class_and_type(type_)
+        if type_class is Union:
+            return self._compile_union(generic_type)
+
+        if not isinstance(type_class, type):  # e.g. forward references
+            return _keep
+
+        args = getattr(generic_type, '__args__', None) or ()
 
-        if not issubclass(field_class, PARAMETRIZED_GENERICS) and type(value) is field_class:
-            return value
+        from simple_model.models import Model
+        if issubclass(type_class, Model):
+            return self._compile_model(type_class)
+
+        if issubclass(type_class, (list, tuple)):
+            return self._compile_sequence(tuple if issubclass(type_class, tuple) else list, args)
+
+        if issubclass(type_class, (set, frozenset)) and args:
+            return self._compile_set(frozenset if issubclass(type_class, frozenset) else set, args[0])
+
+        if issubclass(type_class, dict) and len(args) == 2:
+            return self._compile_dict(*args)
+
+        return self._compile_class(type_class)
+
+    def _compile_element(self, type_):
+        convert = self._get_converter(type_)
+        type_class, generic_type = self._split_class_and_type(type_)
+        if generic_type is not None or type_class is Any or not isinstance(type_class, type):
+            return convert
+
+        # elements already of the expected type (or subclasses) are kept
+        def convert_element(instance, value):
+            return value if isinstance(value, type_class) else convert(instance, value)
+
+        return convert_element
+
+    def _compile_class(self, type_class):
+        def convert(instance, value):
+            if value is None or type(value) is type_class or isinstance(value, type_class):
+                return value
 
+            return get_coercion(type(value), type_class)(value)
+
+        return convert
+
+    def _compile_model(self, model_class):
         from simple_model.models import Model
-        if issubclass(field_class, Model) and isinstance(value, Model):
-            assert type(value) is field_class, ('Field of type {} received an object of invalid '
-                                                'type {}').format(field_class, type(value))
+        has_identity = getattr(getattr(model_class, '_meta', None), 'primary_key', None) is not None
 
-        if issubclass(field_class, Model):
-            return field_class(**value)
+        def convert(instance, value):
+            if value is None or type(value) is model_class:
+                return value
 
-        if issubclass(field_class, (list, tuple)):
-            try:
-                element_field_class = field_type.__args__[0] if field_type.__args__ else None
-            except AttributeError:
-                element_field_class = None
-
-            # if iterable value is a type var refrain from casting to avoid converting to a type
-            # the user may not want , e.g.
-            # T = TypeVar('T', str, bytes)
-            # class Model:
-            #    t: T
-            # what's the correct type to convert here? str? bytes? for now there's no conversion
-            if isinstance(element_field_class, TypeVar):
-                element_field_class = None
-
-            iterable_field_class = tuple if issubclass(field_class, tuple) else list
-            if not element_field_class:
-                return iterable_field_class(value)
-
-            values = []
-            for elem in value:
-                if not isinstance(elem, element_field_class):
-                    elem = self.convert_to_type(instance, elem, field_class=element_field_class)
-                values.append(elem)
-
-            return iterable_field_class(values)
-
-        if isinstance(value, field_class):
-            return value
+            assert not isinstance(value, Model), (
+                'Field of type {} received an object of invalid type {}').format(model_class, type(value))
 
-        return field_class(value)
+            identity_map = active_identity_map() if has_identity else None
+            if identity_map is not None:
+                return identity_map.resolve(model_class, value, lambda: model_class(**value))
+            return model_class(**value)
 
-    def validate(self, instance, value):
-        if not self.allow_empty and self.model_class.is_empty(value):
-            raise EmptyField(self.name)
+        return convert
+
+    def _compile_sequence(self, sequence_class, args):
+        def convert(instance, value):
+            return value if value is None else sequence_class(value)
+
+        if not args:
+            return convert
+
+        if sequence_class is tuple and len(args) > 1 and args[1] is not Ellipsis:
+            return self._compile_fixed_tuple(args)
+
+        from simple_model.models import Model
+        element_type = args[0]
+        convert_element = self._compile_element(element_type)
+        bulk_model_class = element_type if isinstance(element_type, type) and issubclass(element_type, Model) else None
+
+        def convert_sequence(instance, value):
+            if value is None:
+                return value
+
+            # iterators (e.g. generators) are consumed once
+            if not isinstance(value, (list, tuple)):
+                value = list(value)
+
+            # lists of dicts are built into lists of models at once
+            if bulk_model_class and all(type(elem) is dict for elem in value):
+                identity_map = active_identity_map() if bulk_model_class._meta.primary_key is not None else None
+                if identity_map is not None:
+                    return sequence_class(identity_map.resolve(bulk_model_class, elem) for elem in value)
+                return sequence_class(bulk_model_class._init_many(value))
+
+            return sequence_class([convert_element(instance, elem) for elem in value])
+
+        return convert_sequence
+
+    def _compile_fixed_tuple(self, args):
+        convert_elements = [self._compile_element(arg) for arg in args]
+
+        def convert(instance, value):
+            if value is None:
+                return value
 
+            assert len(value) == len(convert_elements), (
+                'Field of type {} received {} values'.format(args, len(value)))
+
+            return tuple(convert_element(instance, elem) for convert_element, elem in zip(convert_elements, value))
+
+        return convert
+
+    def _compile_set(self, set_class, element_type):
+        convert_element = self._compile_element(element_type)
+
+        def convert(instance, value):
+            if value is None:
+                return value
+
+            return set_class(convert_element(instance, elem) for elem in value)
+
+        return convert
+
+    def _compile_dict(self, key_type, value_type):
+        convert_key = self._compile_element(key_type)
+        convert_value = self._compile_element(value_type)
+
+        def convert(instance, value):
+            if value is None:
+                return value
+
+            if not isinstance(value, dict):
+                value = dict(value)
+
+            return {convert_key(instance, key): convert_value(instance, elem) for key, elem in value.items()}
+
+        return convert
+
+    def _compile_union(self, union_type):
+        def convert(instance, value):
+            return value if value is None else self._convert_union(instance, value, union_type)
+
+        return convert
+
+    def _union_member_matches(self, member, value_type):
+        if member is Any:
+            return True
+
+        member_class, _ = self._split_class_and_type(member)
+        try:
+            return issubclass(value_type, member_class)
+        except TypeError:  # e.g. type vars and forward references
+            return False
+
+    def _convert_union(self, instance, value, field_type):
+        value_type = type(value)
+        key = (field_type, value_type)
+
+        try:
+            candidates = self._union_dispatch[key]
+        except KeyError:
+            # values of one of the union types are kept, otherwise they are coerced to the
+            # first union type that accepts them. The order depends only on the value type,
+            # so it's cached, while conversions are always tried in that order
+            members = field_type.__args__
+            matches = [member for member in members if self._union_member_matches(member, value_type)]
+            candidates = tuple(matches + [member for member in members if member not in matches])
+            self._union_dispatch[key] = candidates
+
+        for member in candidates:
+            try:
+                return self._get_converter(member)(instance, value)
+            except (AssertionError, TypeError, ValueError):
+                continue
+
+        raise AssertionError('Field of type {} received an object of invalid type {}'.format(
+            field_type.__args__, value_type))
+
+    def _validate_elements(self, value, strict=False):
+        from .models import BaseModel
+
+        # lists of models of the same class are validated at once
+        model_class = type(value[0]) if value else None
+        bulk = model_class and issubclass(model_class, BaseModel) and model_class.validate is BaseModel.validate
+        if bulk and all(type(elem) is model_class for elem in value):
+            # models validated and not changed since are not validated again
+            changed = [elem for elem in value if not elem._is_clean()]
+            if changed:
+                model_class.validate_many(changed, strict=strict or None)
+            if not model_class._meta.intern:
+                return value
+            return type(value)(elem.intern() for elem in value)
+
+        interned = None
+        for i, elem in enumerate(value):
+            shared = self._validate_value(elem, strict)
+            if shared is not elem:
+                interned = interned or list(value)
+                interned[i] = shared
+
+        return type(value)(interned) if interned is not None else value
+
+    def _validate_value(self, value, strict=False):
+        """
+        Validates the value if it is a model, or the models inside it if it is a container
+        (e.g. Dict[str, List[Foo]]), and returns it with its models interned
+        """
         if isinstance(value, (list, tuple)):
-            for elem in value:
-                try:
-                    elem.validate()
-                except AttributeError:
-                    continue
+            return self._validate_elements(value, strict)
+
+        if isinstance(value, dict):
+            values = list(value.values())
+            validated = self._validate_elements(values, strict)
+            return value if validated is values else dict(zip(value, validated))
+
+        if isinstance(value, (set, frozenset)):
+            elements = list(value)
+            validated = self._validate_elements(elements, strict)
+            return value if validated is elements else type(value)(validated)
 
-        if self._validate:
-            return self._validate(instance, value)
+        from .models import BaseModel
+        if isinstance(value, BaseModel) and value._is_clean():
+            return _intern(value)
 
         try:
-            value.validate()
+            value.validate(strict=True) if strict else value.validate()
         except AttributeError:
             return value
 
-        return value
+        return _intern(value)
+
+    def validate(self, instance, value, strict=False):
+        if not self.allow_empty and self.model_class.is_empty(value):
+            raise EmptyField(self.name)
+
+        if not self._validate:
+            return self._validate_value(value, strict)
+
+        if isinstance(value, (list, tuple, set, frozenset, dict)):
+            value = self._validate_value(value, strict)
+
+        return self._validate(instance, value)
 
     def to_python(self, value):
-        if not value:
+        # enum members may be falsy (e.g. an IntEnum of value 0) but must still be serialized
+        if not value and not isinstance(value, Enum):
             return value
 
-        from .converters import to_dict
-        if not isinstance(value, (list, tuple)):
-            try:
-                return to_dict(value)
-            except (TypeError, ValueError):
-                return value
+        return serialize(value)
 
-        python_value = []
-        for elem in value:
-            try:
-                elem = to_dict(elem)
-            except (TypeError, ValueError):
-                pass
-            python_value.append(elem)
 
-        value_cls = type(python_value)
-        return python_value if issubclass(value_cls, list) else value_cls(python_value)
+class LazyNestedModelDescriptor:
+    """
+    Keeps nested model fields as dicts until their first access, when the nested model is
+    built, validated and stored in place of the dict
+    """
+
+    def __init__(self, field: ModelField):
+        self.field = field
+
+    def __get__(self, instance, owner):
+        field = self.field
+        if instance is None:
+            # like other fields, only fields with a default value are class attributes
+            if field._default_value is Unset:
+                raise AttributeError(field.name)
+            return field._default_value
+
+        try:
+            value = instance.__dict__[field.name]
+        except KeyError:
+            raise AttributeError(field.name)
+
+        if type(value) is dict:
+            value = field.convert_to_type(instance, value)
+            value = field.validate(instance, value)
+            instance.__dict__[field.name] = value
+
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.name] = value
@@ -0,0 +1,91 @@
+"""
+Identity map deduplicating models of classes declaring a primary key (Meta.primary_key)
+while building many models, e.g.:
+
+    identity_map = IdentityMap()
+    orders = Order.build_many(payload, identity_map=identity_map)
+
+Nested dicts with the primary key of a model already built from an identical dict resolve
+to that model, so it's built and validated once. Dicts with the primary key of a model
+built from different values are built separately and reported on identity_map.conflicts.
+"""
+import threading
+from collections import namedtuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import BaseModel  # noqa
+
+IdentityConflict = namedtuple('IdentityConflict', ['model_class', 'primary_key', 'values', 'other_values'])
+
+_local = threading.local()
+
+
+def active_identity_map() -> Optional['IdentityMap']:
+    """
+    Returns the identity map active on the current thread, if any
+    """
+    stack = getattr(_local, 'stack', None)
+    return stack[-1] if stack else None
+
+
+class IdentityMap:
+    def __init__(self):
+        self._models: Dict[Tuple[type, Any], Tuple[Mapping, Any]] = {}
+        self.conflicts: List[IdentityConflict] = []
+        self.hits = 0
+
+    def __enter__(self) -> 'IdentityMap':
+        """
+        Activates the identity map on the current thread: nested dicts converted to models
+        with a primary key are resolved by the identity map
+        """
+        try:
+            _local.stack.append(self)
+        except AttributeError:
+            _local.stack = [self]
+        return self
+
+    def __exit__(self, *exc_info):
+        _local.stack.pop()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def get(self, model_class: Type['BaseModel'], primary_key: Any):
+        """
+        Returns the model of the class with the primary key, or None
+        """
+        entry = self._models.get((model_class, primary_key))
+        return entry[1] if entry else None
+
+    def resolve(self, model_class: Type['BaseModel'], values: Mapping, build: Callable[[], Any] = None):
+        """
+        Returns the model of the class with the primary key in values, if it was built from
+        the same values, otherwise builds it with build() (by default the model class)
+        """
+        if build is None:
+            build = lambda: model_class._init(values)  # noqa: E731
+
+        primary_key = values.get(model_class._meta.primary_key)
+        key = (model_class, primary_key)
+        try:
+            entry = self._models.get(key)
+        except TypeError:  # unhashable primary key
+            return build()
+
+        if primary_key is None:
+            return build()
+
+        if entry is None:
+            model = build()
+            self._models[key] = (values, model)
+            return model
+
+        first_values, model = entry
+        if first_values == values:
+            self.hits += 1
+            return model
+
+        self.conflicts.append(IdentityConflict(model_class, primary_key, first_values, values))
+        return build()
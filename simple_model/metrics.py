@@ -0,0 +1,110 @@
+"""
+Opt-in counters of the work done by models, by model class:
+
+- instances: models created (including Model.construct)
+- validations: models validated (validate() and validate_many())
+- validation_failures: field validation failures, by field
+- serializations: models converted to dict (as_dict() and to_dict())
+- builder_classes: model classes created by model_builder
+
+Counters are disabled by default, call enable() to start counting. Each thread counts on
+its own counters, which are merged on snapshot(), so counting does not need any locking.
+"""
+import threading
+from collections import Counter
+from typing import Dict, List, Tuple
+
+METRICS = {
+    # name: (prometheus name, help, label names)
+    'instances': ('simple_model_instances', 'Model instances created', ('model',)),
+    'validations': ('simple_model_validations', 'Model validations', ('model',)),
+    'validation_failures': ('simple_model_validation_failures', 'Model field validation failures',
+                            ('model', 'field')),
+    'serializations': ('simple_model_serializations', 'Models converted to dict', ('model',)),
+    'builder_classes': ('simple_model_builder_classes', 'Model classes created by model_builder', ('model',)),
+}
+
+enabled = False
+
+_local = threading.local()
+_lock = threading.Lock()
+_counters: List[Counter] = []  # counters of every thread
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    """
+    Sets all counters to zero
+    """
+    with _lock:
+        for counter in _counters:
+            counter.clear()
+
+
+def _get_counter() -> Counter:
+    try:
+        return _local.counter
+    except AttributeError:
+        counter = _local.counter = Counter()
+        with _lock:
+            _counters.append(counter)
+        return counter
+
+
+def increment(metric: str, *labels: str, amount: int = 1):
+    _get_counter()[(metric, *labels)] += amount
+
+
+def snapshot() -> Dict[str, Dict[Tuple[str, ...], int]]:
+    """
+    Returns the counters of all threads merged by metric name and label values, e.g.:
+    {'instances': {('Customer',): 10}, 'validation_failures': {('Customer', 'age'): 1}, ...}
+    """
+    with _lock:
+        counters = [counter.copy() for counter in _counters]
+
+    merged: Counter = Counter()
+    for counter in counters:
+        merged.update(counter)
+
+    result: Dict[str, Dict[Tuple[str, ...], int]] = {metric: {} for metric in METRICS}
+    for (metric, *labels), value in merged.items():
+        if value:
+            result[metric][tuple(labels)] = value
+    return result
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def render(metrics: Dict[str, Dict[Tuple[str, ...], int]] = None, openmetrics: bool = False) -> str:
+    """
+    Returns the counters (by default a new snapshot) in the Prometheus text exposition
+    format, or in the OpenMetrics format if openmetrics is true
+    """
+    if metrics is None:
+        metrics = snapshot()
+
+    lines = []
+    for metric, (name, help_, label_names) in METRICS.items():
+        family = name if openmetrics else name + '_total'
+        lines.append('# HELP {} {}'.format(family, help_))
+        lines.append('# TYPE {} counter'.format(family))
+        for labels, value in sorted(metrics.get(metric, {}).items()):
+            label_pairs = ','.join(
+                '{}="{}"'.format(label_name, _escape(label)) for label_name, label in zip(label_names, labels))
+            lines.append('{}_total{{{}}} {}'.format(name, label_pairs, value))
+
+    if openmetrics:
+        lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
@@ -1,32 +1,68 @@
-from typing import Any, Callable, Iterable, Iterator, Tuple, Union
+import threading
+from concurrent.futures import Executor
+from typing import IO, TYPE_CHECKING, AbstractSet, Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
+from . import metrics
 from .base import ModelMetaClass
-from .exceptions import ValidationError
-from .fields import ModelField
+from .exceptions import FrozenInstanceError, StrictTypeError, ValidationError
+from .fields import ModelField, Unset
 from .utils import getkey
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .identity import IdentityMap  # noqa
+    from .views import ModelView  # noqa
+
+# incremented whenever a field of any model is set
+_generation = 0
+
+
+def _intern_key(values: tuple) -> tuple:
+    """
+    Returns the key of interned models with the given field values. Values types are part
+    of the key, as equal values of different types (e.g. 1, 1.0 and True) must not be shared
+    """
+    return tuple((type(value), _intern_key(value) if type(value) is tuple else value) for value in values)
+
 
 class BaseModel:
+    if TYPE_CHECKING:  # pragma: no cover
+        # set by ModelMetaClass and on validation, declared here for type checkers only as
+        # annotated class attributes would be taken as model fields
+        _meta: Any
+        _is_valid: bool
+        _frozen_values: tuple
+        _frozen_hash: int
+
     def __init__(self, **kwargs):
-        for field_name in self._meta.fields:
-            descriptor = self._meta.descriptors[field_name]
+        self._init_fields(kwargs)
+        self.__post_init__(**kwargs)
 
-            field_value = kwargs.get(field_name)
-            default = descriptor.default_value
-            factory = default if isinstance(default, Callable) else None
-            field_value = factory() if factory and not field_value else kwargs.get(field_name, default)
+    def _init_fields(self, values: Mapping):
+        if metrics.enabled:
+            metrics.increment('instances', type(self).__name__)
 
-            if descriptor and descriptor.is_property:
+        for field_name, default, factory, is_property in self._meta.init_fields:
+            field_value = values.get(field_name, Unset)
+            if field_value is Unset:
+                field_value = factory() if factory else default
+            elif factory and not field_value:
+                field_value = factory()
+
+            if is_property:
                 self.__setattr__(field_name, field_value)
             else:
                 object.__setattr__(self, field_name, field_value)
 
-        self.__post_init__(**kwargs)
-
     def __post_init__(self, **kwargs):
         pass
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
+        if self._meta.frozen and type(other) is type(self) and self._is_valid and other._is_valid:
+            return self._frozen_values == other._frozen_values
+
         if isinstance(other, Model):
             other_fields = list(other._get_fields())
             get_func = getattr
@@ -52,6 +88,18 @@ class BaseModel:
 
         return True
 
+    def _hash(self) -> int:
+        """
+        Hash of frozen models, set as their __hash__ by ModelMetaClass
+        """
+        assert self._is_valid, 'model.validate() must be run before hashing'
+        try:
+            return self._frozen_hash
+        except AttributeError:
+            frozen_hash = hash((type(self), self._frozen_values))
+            object.__setattr__(self, '_frozen_hash', frozen_hash)
+            return frozen_hash
+
     def __repr__(self) -> str:
         attrs = ', '.join(
             '{name}={value!r}'.format(name=name, value=getattr(self, name))
@@ -60,6 +108,14 @@ class BaseModel:
         return '{class_name}({attrs})'.format(class_name=type(self).__name__, attrs=attrs)
 
     def __setattr__(self, name, value):
+        if name in self._meta.descriptors:
+            if self._meta.frozen and self._is_valid:
+                raise FrozenInstanceError(name)
+
+            # models validated before any field was set are not clean anymore
+            global _generation
+            _generation += 1
+
         try:
             super().__setattr__(name, value)
         except AttributeError:
@@ -74,7 +130,12 @@ class BaseModel:
         )
 
     @classmethod
-    def build_many(cls, source: Iterable) -> list:
+    def build_many(cls, source: Iterable, identity_map: 'IdentityMap' = None) -> list:
+        """
+        Returns models built from many dicts with the same keys. If an identity map is given
+        the models fields are converted and models with a primary key (Meta.primary_key)
+        are deduplicated by the identity map, see simple_model.identity
+        """
         if cls.is_empty(source):
             return []
 
@@ -83,7 +144,78 @@ class BaseModel:
             if key_set ^ keys_sets[0]:
                 raise ValueError('All elements in source should have the same keys')
 
-        return [cls(**item) for item in source]
+        if identity_map is None:
+            return [cls(**item) for item in source]
+
+        with identity_map:
+            if cls._meta.primary_key is None:
+                models = [cls(**item) for item in source]
+            else:
+                models = [identity_map.resolve(cls, item, lambda: cls(**item)) for item in source]
+
+            for model in models:
+                model.convert_fields()
+        return models
+
+    @classmethod
+    def _init(cls, values: Mapping) -> 'BaseModel':
+        if cls.__init__ is not BaseModel.__init__:
+            return cls(**values)
+
+        model = object.__new__(cls)
+        model._init_fields(values)
+        model.__post_init__(**values)
+        return model
+
+    @classmethod
+    def _init_many(cls, source: Iterable[dict]) -> List['BaseModel']:
+        return [cls._init(item) for item in source]
+
+    @classmethod
+    def construct(cls, **values) -> 'BaseModel':
+        """
+        Returns a valid model built from trusted values, e.g. values read from validated
+        models. Values are assigned as they are: they are neither converted nor validated and
+        __post_init__ is not called. Missing fields are set to their default values
+        """
+        return cls._construct(values)
+
+    @classmethod
+    def construct_many(cls, rows: Iterable[Mapping]) -> List['BaseModel']:
+        """
+        Returns valid models built from many mappings of trusted values, see Model.construct
+        """
+        construct = cls._construct
+        return [construct(row) for row in rows]
+
+    @classmethod
+    def _construct(cls, values: Mapping) -> 'BaseModel':
+        if metrics.enabled:
+            metrics.increment('instances', cls.__name__)
+
+        model = object.__new__(cls)
+        model_dict = model.__dict__
+        for field_name, default, factory, is_property in cls._meta.init_fields:
+            field_value = values.get(field_name, Unset)
+            if field_value is Unset:
+                field_value = factory() if factory else default
+
+            if is_property:
+                model.__setattr__(field_name, field_value)
+            else:
+                model_dict[field_name] = field_value
+
+        model._mark_valid()
+        return model
+
+    @classmethod
+    def view(cls, mapping: Mapping) -> 'ModelView':
+        """
+        Returns a read-only view of the mapping as a model, converting fields on access
+        instead of copying them to a new instance
+        """
+        from .views import ModelView
+        return ModelView(cls, mapping)
 
     @staticmethod
     def is_empty(value: Any) -> bool:
@@ -92,8 +224,11 @@ class BaseModel:
         return not bool(value)
 
     def convert_fields(self):
-        for name, descriptor in self._get_fields():
-            if descriptor.is_property:
+        self._convert_fields(self._get_fields())
+
+    def _convert_fields(self, fields: Iterable[Tuple[str, ModelField]]):
+        for name, descriptor in fields:
+            if descriptor.is_property or name in self._meta.lazy_fields and self._is_deferred(name):
                 continue
 
             value = object.__getattribute__(self, name)
@@ -101,39 +236,299 @@ class BaseModel:
 
             object.__setattr__(self, name, new_value)
 
-    def validate(self, raise_exception: bool = True) -> Union[None, bool]:
-        self.convert_fields()
+    def _is_deferred(self, name: str) -> bool:
+        """
+        Returns whether the field is a lazy nested model not built yet
+        """
+        return type(self.__dict__.get(name)) is dict
 
-        for name, descriptor in self._get_fields():
-            if descriptor.is_property and descriptor._validate is None:
-                continue
+    def _mark_valid(self):
+        self._is_valid = True
+        object.__setattr__(self, '_valid_generation', _generation)
+        if self._meta.frozen:
+            values = tuple(getattr(self, name) for name in self._meta.fields)
+            object.__setattr__(self, '_frozen_values', values)
+            self.__dict__.pop('_frozen_hash', None)
+
+    def _check_field(self, name: str, descriptor: ModelField):
+        if not descriptor.check_type(object.__getattribute__(self, name)):
+            self._is_valid = False
+            if metrics.enabled:
+                metrics.increment('validation_failures', type(self).__name__, name)
+            raise StrictTypeError(name, descriptor._type)
 
-            value = object.__getattribute__(self, name)
-            try:
-                value = descriptor.validate(self, value)
-            except ValidationError:
-                self._is_valid = False
-                if raise_exception:
-                    raise
-                return False
-            except Exception:
-                self._is_valid = False
+    def _is_clean(self) -> bool:
+        """
+        Returns whether the model is valid and no model field was set since its validation.
+        Clean nested models are not validated again on their parent validation. Changes not
+        made by setting fields (e.g. appending to a list field) are not tracked
+        """
+        return self._is_valid and self.__dict__.get('_valid_generation') == _generation
+
+    def _validate_field(self, name: str, descriptor: ModelField, strict: bool = False):
+        value = object.__getattribute__(self, name)
+        try:
+            value = descriptor.validate(self, value, strict=strict)
+        except Exception:
+            self._is_valid = False
+            if metrics.enabled:
+                metrics.increment('validation_failures', type(self).__name__, name)
+            raise
+
+        try:
+            object.__setattr__(self, name, value)
+        except AttributeError:
+            self.__setattr__(name, value)
+
+    def _validate_fields(
+        self, fields: Iterable[Tuple[str, ModelField]], raise_exception: bool, strict: bool = False,
+    ) -> Union[None, bool]:
+        try:
+            for name, descriptor in fields:
+                if descriptor.is_property and descriptor._validate is None:
+                    continue
+
+                if name in self._meta.lazy_fields and self._is_deferred(name):
+                    continue
+
+                if strict:
+                    self._check_field(name, descriptor)
+                self._validate_field(name, descriptor, strict)
+        except ValidationError:
+            if raise_exception:
                 raise
+            return False
 
-            try:
-                object.__setattr__(self, name, value)
-            except AttributeError:
-                self.__setattr__(name, value)
+        self._mark_valid()
+        return None if raise_exception else True
 
-        self._is_valid = True
+    def validate(self, raise_exception: bool = True, strict: bool = None) -> Union[None, bool]:
+        """
+        Converts and validates the model fields. On strict validation (strict=True or
+        Meta.strict = True) fields are not converted: values must be exactly of the field
+        types, otherwise StrictTypeError is raised
+        """
+        if self._meta.frozen and self._is_valid:
+            return None if raise_exception else True
+
+        if metrics.enabled:
+            metrics.increment('validations', type(self).__name__)
+
+        strict = self._meta.strict if strict is None else strict
+        if not strict:
+            self.convert_fields()
+        return self._validate_fields(self._get_fields(), raise_exception, strict)
+
+    @classmethod
+    def validate_many(
+        cls, models: Sequence['BaseModel'], raise_exception: bool = True, strict: bool = None,
+        executor: Executor = None, chunk_size: int = 1000,
+    ) -> Union[None, bool]:
+        """
+        Validates many models of the class at once. Instead of validating one model at a
+        time, each field is converted and validated for all the models before moving on
+        to the next field.
+
+        If an executor is given (e.g. a ThreadPoolExecutor) models are validated in chunks
+        of chunk_size models submitted to the executor.
+        """
+        if executor is not None:
+            return cls._validate_many_chunks(models, raise_exception, strict, executor, chunk_size)
+
+        models = [model for model in models if not (model._meta.frozen and model._is_valid)]
+        assert all(type(model) is cls for model in models), (
+            'All models should be instances of {}'.format(cls.__name__))
+
+        if metrics.enabled:
+            metrics.increment('validations', cls.__name__, amount=len(models))
+
+        strict = cls._meta.strict if strict is None else strict
+        fields = [(name, cls._meta.descriptors[name]) for name in cls._meta.fields]
+        for name, descriptor in fields:
+            if descriptor.is_property or strict:
+                continue
+
+            convert_to_type = descriptor.convert_to_type
+            for model in models:
+                if name in cls._meta.lazy_fields and model._is_deferred(name):
+                    continue
+
+                value = object.__getattribute__(model, name)
+                object.__setattr__(model, name, convert_to_type(model, value))
+
+        try:
+            for name, descriptor in fields:
+                if descriptor.is_property and descriptor._validate is None:
+                    continue
+
+                for model in models:
+                    if name in cls._meta.lazy_fields and model._is_deferred(name):
+                        continue
+
+                    if strict:
+                        model._check_field(name, descriptor)
+                    model._validate_field(name, descriptor, strict)
+        except ValidationError:
+            if raise_exception:
+                raise
+            return False
+
+        for model in models:
+            model._mark_valid()
         return None if raise_exception else True
 
-    def as_dict(self):
+    @classmethod
+    def _validate_many_chunks(
+        cls, models: Sequence['BaseModel'], raise_exception: bool, strict: Optional[bool], executor: Executor,
+        chunk_size: int,
+    ) -> Union[None, bool]:
+        assert chunk_size > 0, 'chunk_size must be positive'
+        models = list(models)
+        futures = [
+            executor.submit(cls.validate_many, models[start:start + chunk_size], raise_exception, strict)
+            for start in range(0, len(models), chunk_size)
+        ]
+
+        # results are waited in order, so the first chunk error is raised
+        results = [future.result() for future in futures]
+        if raise_exception:
+            return None
+        return all(results)
+
+    def replace(self, **changes) -> 'BaseModel':
         """
-        Returns the model as a dict
+        Returns a copy of the model with the given fields changed. Nested model fields
+        are changed using "__" separated paths, e.g.: address__city='Recife'.
+
+        Unchanged field values are shared with the original model. If the model is valid
+        the copy is valid as well, as only the changed fields (and validated properties)
+        are converted and validated again. __post_init__ is not called on the copy.
+        """
+        nested_changes: dict = {}
+        for key in [key for key in changes if '__' in key]:
+            name, path = key.split('__', 1)
+            nested_changes.setdefault(name, {})[path] = changes.pop(key)
+
+        for name, field_changes in nested_changes.items():
+            assert name not in changes, 'Field {!r} cannot be replaced and changed at once'.format(name)
+            changes[name] = getattr(self, name).replace(**field_changes)
+
+        unknown_fields = set(changes) - set(self._meta.fields)
+        if unknown_fields:
+            raise TypeError('{} model has no fields {}'.format(
+                type(self).__name__, ', '.join(sorted(unknown_fields))))
+
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new.__dict__.pop('_is_valid', None)
+        new.__dict__.pop('_frozen_hash', None)
+        new.__dict__.pop('_lock', None)
+
+        for name, value in changes.items():
+            if self._meta.descriptors[name].is_property:
+                setattr(new, name, value)
+            else:
+                object.__setattr__(new, name, value)
+
+        if not self._is_valid:
+            return new
+
+        fields = [
+            (name, descriptor) for name, descriptor in new._get_fields()
+            if name in changes or (descriptor.is_property and descriptor._validate)
+        ]
+        strict = self._meta.strict
+        if not strict:
+            new._convert_fields(fields)
+        new._validate_fields(fields, raise_exception=True, strict=strict)
+        return new
+
+    def as_dict(self, include: AbstractSet[str] = None, exclude: AbstractSet[str] = None):
+        """
+        Returns the model as a dict. Use include and exclude to choose which fields are
+        converted, e.g.: model.as_dict(include={'name', 'address__city'})
         """
         from .converters import to_dict
-        return to_dict(self)
+        return to_dict(self, include=include, exclude=exclude)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the model encoded in a compact binary format, see simple_model.binary
+        """
+        from .binary import to_bytes
+        return to_bytes(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BaseModel':
+        """
+        Returns the model decoded from bytes returned by model.to_bytes()
+        """
+        from .binary import from_bytes
+        return from_bytes(cls, data)
+
+    @classmethod
+    def to_bytes_many(cls, models: Iterable['BaseModel']) -> bytes:
+        """
+        Returns many models of the class encoded in a compact binary format
+        """
+        from .binary import to_bytes_many
+        return to_bytes_many(cls, models)
+
+    @classmethod
+    def from_bytes_many(cls, data: bytes) -> List['BaseModel']:
+        """
+        Returns the models decoded from bytes returned by Model.to_bytes_many()
+        """
+        from .binary import from_bytes_many
+        return from_bytes_many(cls, data)
+
+    @classmethod
+    def abuild(
+        cls, source: AsyncIterable[dict], concurrency: int = 4, max_pending: int = None, batch_size: int = 100,
+        executor: Executor = None, validate: bool = True,
+    ) -> AsyncIterator['BaseModel']:
+        """
+        Asynchronously yields models built and validated from an async iterable of dicts, in
+        order, building batches of dicts on an executor, see simple_model.aio.abuild
+        """
+        from .aio import abuild
+        return abuild(
+            cls, source, concurrency=concurrency, max_pending=max_pending, batch_size=batch_size,
+            executor=executor, validate=validate,
+        )
+
+    @classmethod
+    def iter_csv(cls, fileobj: IO[str], validate: bool = True, **fmtparams) -> Iterator['BaseModel']:
+        """
+        Yields models read from a CSV file with a header row, see simple_model.csv_io
+        """
+        from .csv_io import iter_csv
+        return iter_csv(cls, fileobj, validate=validate, **fmtparams)
+
+    @classmethod
+    def write_csv(cls, models: Iterable['BaseModel'], fileobj: IO[str], fields: Sequence[str] = None,
+                  **fmtparams) -> int:
+        """
+        Writes models to a CSV file with a header row, returning the number of models written
+        """
+        from .csv_io import write_csv
+        return write_csv(cls, models, fileobj, fields=fields, **fmtparams)
+
+    def intern(self):
+        """
+        Returns the shared instance of the model with the same field values, registering
+        this one if there is none. Models must be frozen and set Meta.intern = True
+        """
+        assert self._meta.intern, '{} model must set Meta.intern'.format(type(self).__name__)
+
+        if not self._is_valid:
+            self.validate()
+
+        try:
+            with self._meta.intern_lock:
+                return self._meta.intern_table.setdefault(_intern_key(self._frozen_values), self)
+        except TypeError:  # unhashable field values
+            return self
 
 
 class Model(BaseModel, metaclass=ModelMetaClass):
@@ -154,27 +549,69 @@ class LazyModel(BaseModel, metaclass=ModelMetaClass):
     simple_model.exceptions.EmptyField: 'foo' field cannot be empty
     """
 
+    def _get_lock(self) -> threading.RLock:
+        instance_dict = object.__getattribute__(self, '__dict__')
+        try:
+            return instance_dict['_lock']
+        except KeyError:
+            return instance_dict.setdefault('_lock', threading.RLock())
+
     def __getattribute__(self, name):
         meta = object.__getattribute__(self, '_meta')
-        if name in meta.fields and not self._is_valid:
-            validate = object.__getattribute__(self, 'validate')
-            validate()
+        if name not in meta.fields:
+            return object.__getattribute__(self, name)
+
+        # fields are read without locking as in a seqlock: _version is odd while a field is
+        # being set and incremented again once it is set, so a read is kept only if the model
+        # is valid and _version was even and unchanged meanwhile. Otherwise the model is
+        # validated holding its lock, so concurrent reads never see unvalidated values
+        instance_dict = object.__getattribute__(self, '__dict__')
+        version = instance_dict.get('_version', 0)
+        if not version % 2 and self._is_valid:
+            value = object.__getattribute__(self, name)
+            if instance_dict.get('_version', 0) == version:
+                return value
 
-        return object.__getattribute__(self, name)
+        with object.__getattribute__(self, '_get_lock')():
+            if not self._is_valid:
+                validate = object.__getattribute__(self, 'validate')
+                validate()
+            return object.__getattribute__(self, name)
 
     def __setattr__(self, name, value):
         meta = object.__getattribute__(self, '_meta')
-        if name in meta.fields and self._is_valid:
-            self._is_valid = False
+        if name not in meta.fields:
+            return super().__setattr__(name, value)
+
+        with self._get_lock():
+            if self._is_valid and meta.frozen:
+                raise FrozenInstanceError(name)
+
+            instance_dict = object.__getattribute__(self, '__dict__')
+            instance_dict['_version'] = instance_dict.get('_version', 0) + 1
+            try:
+                self._is_valid = False
+                super().__setattr__(name, value)
+            finally:
+                instance_dict['_version'] += 1
 
-        return super().__setattr__(name, value)
+    def validate(self, raise_exception: bool = True, strict: bool = None) -> Union[None, bool]:
+        with self._get_lock():
+            return super().validate(raise_exception=raise_exception, strict=strict)
 
-    def as_dict(self):
+    def __getstate__(self):
+        state = dict(object.__getattribute__(self, '__dict__'))
+        state.pop('_lock', None)
+        return state
+
+    def as_dict(self, include: AbstractSet[str] = None, exclude: AbstractSet[str] = None):
         """
-        Returns the model as a dict
+        Returns the model as a dict. Use include and exclude to choose which fields are
+        converted, e.g.: model.as_dict(include={'name', 'address__city'})
         """
-        if not self._is_valid:
-            self.validate()
+        with self._get_lock():
+            if not self._is_valid:
+                self.validate()
 
-        from .converters import to_dict
-        return to_dict(self)
+            from .converters import to_dict
+            return to_dict(self, include=include, exclude=exclude)
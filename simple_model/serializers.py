@@ -0,0 +1,68 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict
+from uuid import UUID
+
+_serializers: Dict[type, Callable] = {}
+_serializers_cache: Dict[type, Callable] = {}
+
+
+def register_serializer(type_: type, serializer: Callable[[Any], Any]):
+    """
+    Registers the function used to convert values of the given type (and its subclasses)
+    when models are converted to dict
+    """
+    _serializers[type_] = serializer
+    _serializers_cache.clear()
+
+
+def get_serializer(type_: type) -> Callable[[Any], Any]:
+    try:
+        return _serializers_cache[type_]
+    except KeyError:
+        pass
+
+    mro = type_.__mro__
+    if issubclass(type_, Enum):
+        # mixed-in enums (e.g. IntEnum) have their value type before Enum in the mro
+        mro = tuple(cls for cls in mro if issubclass(cls, Enum)) + mro
+
+    serializer = next(_serializers[cls] for cls in mro if cls in _serializers)
+    _serializers_cache[type_] = serializer
+    return serializer
+
+
+def serialize(value: Any) -> Any:
+    try:
+        serializer = _serializers_cache[type(value)]
+    except KeyError:
+        serializer = get_serializer(type(value))
+    return serializer(value)
+
+
+def _identity(value):
+    return value
+
+
+def _serialize_enum(value: Enum):
+    return value.value
+
+
+def _serialize_iterable(value):
+    return [serialize(elem) for elem in value]
+
+
+def _serialize_dict(value):
+    return {key: serialize(elem) for key, elem in value.items()}
+
+
+for type_ in (object, bool, bytes, date, datetime, Decimal, float, int, str, time, type(None), UUID):
+    register_serializer(type_, _identity)
+
+register_serializer(Enum, _serialize_enum)
+register_serializer(dict, _serialize_dict)
+register_serializer(list, _serialize_iterable)
+register_serializer(tuple, _serialize_iterable)
+register_serializer(set, _serialize_iterable)
+register_serializer(frozenset, _serialize_iterable)
@@ -0,0 +1,123 @@
+"""
+File backed storage of models of one class, encoded with simple_model.binary and read
+through mmap, so opening a store does not load its models. The file layout is:
+
+- header: magic, schema fingerprint, model count and index offset
+- models encoded one after the other
+- index: offset of each model in the file
+"""
+import mmap
+import struct
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator, Type
+
+from .binary import SchemaMismatch, _get_model_codec
+from .models import BaseModel
+
+MAGIC = b'SMS\x01'
+
+_header = struct.Struct('<4sIQQ')
+_offset = struct.Struct('<Q')
+
+
+class ModelStore:
+    """
+    Read-only store of models of one class. Models are decoded on access and the most
+    recently accessed ones are kept in a cache of cache_size models, e.g.:
+
+    >>> ModelStore.write('products.db', Product, products)
+    >>> with ModelStore('products.db', Product) as store:
+    ...     store[42]
+    """
+
+    def __init__(self, path: str, model_class: Type[BaseModel], cache_size: int = 1024):
+        self.path = path
+        self.model_class = model_class
+        self.cache_size = cache_size
+        self._codec = _get_model_codec(model_class)
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, fingerprint, self._size, self._index_offset = _header.unpack_from(self._data, 0)
+        if magic != MAGIC or fingerprint != model_class._meta.binary_fingerprint:
+            self.close()
+            raise SchemaMismatch('{} was not written from the current {} schema'.format(path, model_class.__name__))
+
+    @classmethod
+    def write(cls, path: str, model_class: Type[BaseModel], models: Iterable[BaseModel]) -> int:
+        """
+        Writes the models to a store file, returning how many models were written
+        """
+        codec = _get_model_codec(model_class)
+        offsets = []
+        with open(path, 'wb') as f:
+            f.write(bytes(_header.size))
+            offset = _header.size
+            for model in models:
+                assert type(model) is model_class, 'All models should be instances of {}'.format(model_class.__name__)
+                assert model._is_valid, 'model.validate() must be run before conversion'
+
+                buffer = bytearray()
+                codec.encode(buffer, model)
+                f.write(buffer)
+                offsets.append(offset)
+                offset += len(buffer)
+
+            for model_offset in offsets:
+                f.write(_offset.pack(model_offset))
+
+            f.seek(0)
+            f.write(_header.pack(MAGIC, model_class._meta.binary_fingerprint, len(offsets), offset))
+
+        return len(offsets)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> BaseModel:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('store index out of range')
+
+        with self._lock:
+            try:
+                model = self._cache[index]
+            except KeyError:
+                pass
+            else:
+                self._cache.move_to_end(index)
+                return model
+
+        model = self._decode(index)
+        with self._lock:
+            self._cache[index] = model
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return model
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        # models are decoded one after the other without going through the cache
+        offset = _header.size
+        for _ in range(self._size):
+            model, offset = self._codec.decode(self._data, offset)
+            yield model
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _decode(self, index: int) -> BaseModel:
+        offset = _offset.unpack_from(self._data, self._index_offset + index * _offset.size)[0]
+        model, _ = self._codec.decode(self._data, offset)
+        return model
+
+    def close(self):
+        self._cache.clear()
+        self._data.close()
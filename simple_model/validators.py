@@ -0,0 +1,75 @@
+"""
+Helpers for field validators (``validate_<field>`` model methods)
+"""
+import threading
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from typing import Any, Callable
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_missing = object()
+_passed = object()  # cached when the validator returned the validated value itself
+
+
+def pure_validator(validator: Callable = None, maxsize: int = 1024):
+    """
+    Marks a field validator as pure, i.e. its result depends only on the validated value,
+    memoizing its results by value (and value type) in a LRU cache of maxsize entries.
+    Unhashable values are not cached and neither are validation errors. When the validator
+    returns the value itself, later equal values (e.g. Decimal('1.00') after Decimal('1.0'))
+    are kept as they are instead of being replaced by the cached value.
+
+    The decorated validator has cache_info() and cache_clear() methods, as functools.lru_cache:
+
+        class Document(Model):
+            number: str
+
+            @pure_validator(maxsize=10_000)
+            def validate_number(self, number):
+                ...
+
+        Document.validate_number.cache_info()
+    """
+    if validator is None:
+        return lambda validator: pure_validator(validator, maxsize=maxsize)
+
+    assert maxsize > 0, 'pure_validator maxsize must be positive'
+    cache: 'OrderedDict[Any, Any]' = OrderedDict()
+    lock = threading.Lock()
+    stats = [0, 0]  # hits, misses
+
+    @wraps(validator)
+    def validate(instance, value):
+        key = (type(value), value)
+        try:
+            with lock:
+                result = cache.get(key, _missing)
+                if result is not _missing:
+                    cache.move_to_end(key)
+                    stats[0] += 1
+                    # equal values may still differ, e.g. Decimal('1.0') and Decimal('1.00')
+                    return value if result is _passed else result
+                stats[1] += 1
+        except TypeError:  # unhashable value
+            return validator(instance, value)
+
+        result = validator(instance, value)
+        with lock:
+            cache[key] = _passed if result is value else result
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+        return result
+
+    def cache_info() -> CacheInfo:
+        with lock:
+            return CacheInfo(stats[0], stats[1], maxsize, len(cache))
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            stats[0] = stats[1] = 0
+
+    validate.cache_info = cache_info  # type: ignore
+    validate.cache_clear = cache_clear  # type: ignore
+    return validate
@@ -0,0 +1,141 @@
+import inspect
+from typing import TYPE_CHECKING, Any, Mapping, Type, Union
+
+from .base import ModelMetaClass
+from .exceptions import ValidationError
+from .fields import Unset
+from .serializers import register_serializer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import BaseModel  # noqa
+
+
+def _is_same(value, new_value) -> bool:
+    if new_value is value:
+        return True
+
+    # containers are copied on conversion even when none of their elements is converted
+    if type(new_value) is not type(value) or not isinstance(value, (list, tuple)):
+        return False
+    return len(new_value) == len(value) and all(new_elem is elem for new_elem, elem in zip(new_value, value))
+
+
+class ModelView:
+    """
+    Read-only view of a mapping as a model of the given class. Fields are read from the
+    mapping and converted on access, without copying the mapping, e.g.:
+
+    >>> view = Person.view({'name': 'John', 'age': '18'})
+    >>> view.age
+    18
+
+    Nested model fields holding mappings are viewed as well.
+    """
+
+    __slots__ = ('_model_class', '_mapping', '_converted', '_is_valid')
+
+    def __init__(self, model_class: Type['BaseModel'], mapping: Mapping):
+        object.__setattr__(self, '_model_class', model_class)
+        object.__setattr__(self, '_mapping', mapping)
+        object.__setattr__(self, '_converted', {})  # field name -> value converted from mapping
+        object.__setattr__(self, '_is_valid', False)
+
+    def __getattr__(self, name):
+        try:
+            return self._converted[name]
+        except KeyError:
+            pass
+
+        try:
+            descriptor = self._model_class._meta.descriptors[name]
+        except KeyError:
+            # model methods and properties are bound to the view so validators can use them
+            attr = inspect.getattr_static(self._model_class, name)
+            if isinstance(attr, (staticmethod, classmethod)) or not hasattr(attr, '__get__'):
+                return getattr(self._model_class, name)
+            return attr.__get__(self, type(self))
+
+        if descriptor.is_property:
+            return getattr(self._model_class, name).fget(self)
+
+        value = self._mapping.get(name, Unset)
+        if value is Unset:
+            default = descriptor.default_value
+            value = default() if callable(default) else default
+
+        if isinstance(descriptor._type, ModelMetaClass) and isinstance(value, Mapping):
+            new_value = descriptor._type.view(value)
+        else:
+            new_value = descriptor.convert_to_type(self, value)
+
+        if _is_same(value, new_value) and name in self._mapping:
+            return value
+
+        self._converted[name] = new_value
+        return new_value
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} view is read-only'.format(self._model_class.__name__))
+
+    def __repr__(self) -> str:
+        return '{}.view({!r})'.format(self._model_class.__name__, self._mapping)
+
+    @property
+    def model_class(self) -> Type['BaseModel']:
+        return self._model_class
+
+    @property
+    def mapping(self) -> Mapping:
+        return self._mapping
+
+    def validate(self, raise_exception: bool = True) -> Union[None, bool]:
+        for name, descriptor in self._model_class._meta.descriptors.items():
+            if descriptor.is_property and descriptor._validate is None:
+                continue
+
+            value = getattr(self, name)
+            try:
+                new_value = descriptor.validate(self, value)
+            except ValidationError:
+                object.__setattr__(self, '_is_valid', False)
+                if raise_exception:
+                    raise
+                return False
+
+            if new_value is not value:
+                self._converted[name] = new_value
+
+        object.__setattr__(self, '_is_valid', True)
+        return None if raise_exception else True
+
+    def _is_unchanged(self) -> bool:
+        fields = self._model_class._meta.descriptors
+        if len(self._mapping) != len(fields) or any(name not in self._mapping for name in fields):
+            return False
+
+        return all(
+            isinstance(value, ModelView) and value._is_unchanged() and value._mapping is self._mapping[name]
+            for name, value in self._converted.items()
+        )
+
+    def as_dict(self) -> Mapping:
+        """
+        Returns the view as a dict. The viewed mapping itself is returned when none of its
+        values was converted or changed on validation
+        """
+        assert self._is_valid, 'view.validate() must be run before conversion'
+
+        if self._is_unchanged():
+            return self._mapping
+
+        return {
+            name: descriptor.to_python(getattr(self, name))
+            for name, descriptor in self._model_class._meta.descriptors.items()
+        }
+
+
+def _serialize_view(view: ModelView) -> Any:
+    return view.as_dict()
+
+
+register_serializer(ModelView, _serialize_view)
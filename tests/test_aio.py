@@ -0,0 +1,127 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from simple_model import Model
+from simple_model.exceptions import EmptyField
+
+
+class Record(Model):
+    id: int
+    name: str
+
+    def validate_name(self, name):
+        return name.strip()
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class Source:
+    def __init__(self, rows):
+        self.rows = rows
+        self.read = 0
+
+    async def __aiter__(self):
+        for row in self.rows:
+            await asyncio.sleep(0)
+            self.read += 1
+            yield row
+
+
+def rows(count):
+    return [{'id': str(i), 'name': ' record {} '.format(i)} for i in range(count)]
+
+
+async def collect(models):
+    return [model async for model in models]
+
+
+def test_abuild():
+    models = run(collect(Record.abuild(Source(rows(1000)), batch_size=64)))
+
+    assert [model.id for model in models] == list(range(1000))
+    assert models[10].name == 'record 10'
+    assert all(model._is_valid for model in models)
+
+
+def test_abuild_executor_without_validation():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        models = run(collect(Record.abuild(Source(rows(10)), batch_size=3, executor=executor, validate=False)))
+
+    assert [model.id for model in models] == [str(i) for i in range(10)]
+    assert not any(model._is_valid for model in models)
+
+
+def test_abuild_backpressure():
+    source = Source(rows(100))
+    read_counts = []
+
+    async def consume():
+        async for model in Record.abuild(source, concurrency=2, max_pending=10, batch_size=4):
+            read_counts.append(source.read)
+            await asyncio.sleep(0)
+
+    run(consume())
+
+    assert len(read_counts) == 100
+    assert max(read_counts[i] - i for i in range(100)) <= 10
+
+
+def test_abuild_validation_error_in_order():
+    data = rows(20)
+    data[7]['name'] = ''
+    models = []
+
+    async def consume():
+        async for model in Record.abuild(Source(data), batch_size=5):
+            models.append(model)
+
+    with pytest.raises(EmptyField):
+        run(consume())
+
+    assert [model.id for model in models] == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_abuild_validation_error_yields_valid_models_of_batch():
+    data = rows(20)
+    data[13]['name'] = ''
+    models = []
+
+    async def consume():
+        async for model in Record.abuild(Source(data), batch_size=10, concurrency=1):
+            models.append(model)
+
+    with pytest.raises(EmptyField):
+        run(consume())
+
+    assert [model.id for model in models] == list(range(13))
+
+
+def test_abuild_empty_source():
+    assert run(collect(Record.abuild(Source([])))) == []
+
+
+def test_abuild_close_early():
+    source = Source(rows(1000))
+
+    async def first():
+        models = Record.abuild(source, batch_size=10)
+        model = await models.__anext__()
+        await models.aclose()
+        return model
+
+    assert run(first()).id == 0
+    assert source.read <= 40
+
+
+@pytest.mark.parametrize('options', ({'concurrency': 0}, {'batch_size': 0}, {'max_pending': 0}))
+def test_abuild_invalid_options(options):
+    with pytest.raises(AssertionError):
+        run(collect(Record.abuild(Source([]), **options)))
@@ -0,0 +1,146 @@
+import typing
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from uuid import uuid4
+
+import pytest
+
+from simple_model import Model
+from simple_model.binary import SchemaMismatch, from_bytes, from_bytes_many, to_bytes, to_bytes_many
+
+
+class Color(Enum):
+    red = 'red'
+    blue = 'blue'
+
+
+class Tag(Model):
+    name: str
+    weight: float = 1.0
+
+
+class Product(Model):
+    active: bool
+    amount: int
+    color: Color
+    created_at: datetime
+    day: date
+    extra: typing.Any
+    id: typing.Any
+    meta: typing.Dict[str, int]
+    pair: typing.Tuple[int, str]
+    payload: bytes
+    price: Decimal
+    tag: Tag
+    tags: typing.List[Tag]
+    title: str
+    description: typing.Optional[str] = None
+
+
+@pytest.fixture
+def product():
+    product = Product(
+        active=True,
+        amount=-42,
+        color=Color.blue,
+        created_at=datetime(2019, 7, 4, 10, 20),
+        day=date(2019, 7, 4),
+        extra={'a': [1, 2.5, 'b', None, True]},
+        id=uuid4().hex,
+        meta={'a': 1},
+        pair=(1, 'one'),
+        payload=b'\x00\x01',
+        price=Decimal('9.90'),
+        tag={'name': 'new'},
+        tags=[{'name': 'a', 'weight': 0.5}, {'name': 'b'}],
+        title='Pants',
+    )
+    product.validate()
+    return product
+
+
+def test_to_bytes_from_bytes(product):
+    data = to_bytes(product)
+
+    decoded = from_bytes(Product, data)
+
+    assert isinstance(data, bytes)
+    assert decoded == product
+    assert decoded._is_valid is True
+    assert decoded.as_dict() == product.as_dict()
+    assert decoded.description is None
+
+
+@pytest.mark.parametrize('amount', (2 ** 63 - 1, 2 ** 63, -2 ** 63, 10 ** 40, -10 ** 40))
+def test_to_bytes_large_ints(product, amount):
+    product.amount = amount
+    product.extra = [amount]
+    product.validate()
+
+    decoded = from_bytes(Product, to_bytes(product))
+
+    assert decoded.amount == amount
+    assert decoded.extra == [amount]
+
+
+def test_model_to_bytes_from_bytes(product):
+    assert Product.from_bytes(product.to_bytes()) == product
+
+
+def test_to_bytes_is_smaller_than_repr(product):
+    assert len(product.to_bytes()) < len(repr(product.as_dict()))
+
+
+def test_to_bytes_not_validated(product):
+    product._is_valid = False
+
+    with pytest.raises(AssertionError):
+        to_bytes(product)
+
+
+def test_from_bytes_schema_mismatch(product):
+    class OtherTag(Model):
+        name: str
+
+    with pytest.raises(SchemaMismatch):
+        from_bytes(Tag, product.to_bytes())
+
+    tag = OtherTag(name='a')
+    tag.validate()
+    with pytest.raises(SchemaMismatch):
+        from_bytes(Tag, tag.to_bytes())
+
+
+def test_to_bytes_any_field_unsupported_type(product):
+    product.extra = object()
+
+    with pytest.raises(TypeError):
+        product.to_bytes()
+
+
+def test_to_bytes_many_from_bytes_many(product):
+    tags = [Tag(name='a'), Tag(name='b', weight=2)]
+    for tag in tags:
+        tag.validate()
+
+    data = to_bytes_many(Tag, tags)
+
+    assert from_bytes_many(Tag, data) == tags
+    assert Tag.from_bytes_many(Tag.to_bytes_many(tags)) == tags
+    assert Tag.from_bytes_many(Tag.to_bytes_many([])) == []
+
+
+def test_to_bytes_nested_in_itself():
+    class Node(Model):
+        value: int
+        children: list = list
+
+    Node._meta.descriptors['children']._type = typing.List[Node]
+    node = Node(value=1, children=[Node(value=2)])
+    node.validate()
+
+    decoded = Node.from_bytes(node.to_bytes())
+
+    assert decoded.children[0].value == 2
+    assert decoded.children[0].children == []
@@ -1,3 +1,4 @@
+import sys
 import typing
 
 import pytest
@@ -188,3 +189,31 @@ def test_model_many_builder_custom_cls():
 
     assert len(models) == 3
     assert all(foo.baz() for foo in models)
+
+
+def test_model_builder_deeply_nested_data():
+    depth = 3 * sys.getrecursionlimit()
+    data = leaf = {}
+    for _ in range(depth):
+        leaf['child'] = {}
+        leaf = leaf['child']
+    leaf['value'] = 1
+
+    model = model_builder(data)
+
+    for _ in range(depth):
+        model = model.child
+    assert model.value == 1
+
+
+def test_model_builder_nested_lists_of_dicts():
+    data = {'items': ({'fooBar': {'baz': 1}}, 2, [{'qux': 3}])}
+
+    model = model_builder(data)
+
+    assert isinstance(model.items, list)
+    assert type(model.items[0]).__name__ == 'NamelessModel'
+    assert type(model.items[0].foo_bar).__name__ == 'FooBar'
+    assert model.items[0].foo_bar.baz == 1
+    assert model.items[1] == 2
+    assert model.items[2] == [{'qux': 3}]
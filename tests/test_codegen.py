@@ -0,0 +1,102 @@
+import json
+import typing
+
+import pytest
+
+from simple_model import Model
+from simple_model.codegen import generate_source, main
+
+SAMPLES = [
+    {
+        'fullName': 'John',
+        'age': 42,
+        'score': 1,
+        'active': True,
+        'address': {'city': 'Recife', 'zipCode': None},
+        'orders': [{'id': 1, 'items': [{'sku': 'a'}]}, {'id': 2, 'items': []}],
+        'tags': ['a'],
+        'extra': 1,
+        '__private': 1,
+    },
+    {
+        'fullName': 'Jane',
+        'age': 43,
+        'score': 1.5,
+        'active': False,
+        'address': {'city': 'Olinda', 'zipCode': '50000'},
+        'orders': [],
+        'tags': [],
+        'extra': 'a',
+        'nickname': 'J',
+    },
+]
+
+
+def load(source):
+    namespace = {}
+    exec(compile(source, 'models.py', 'exec'), namespace)
+    return namespace
+
+
+def test_generate_source():
+    namespace = load(generate_source(SAMPLES, class_name='Customer'))
+    Customer, Address, Order, Items = (namespace[name] for name in ('Customer', 'Address', 'Orders', 'Items'))
+
+    assert issubclass(Customer, Model)
+    assert typing.get_type_hints(Customer) == {
+        'full_name': str,
+        'age': int,
+        'score': float,
+        'active': bool,
+        'address': Address,
+        'orders': typing.Optional[typing.List[Order]],
+        'tags': typing.Optional[typing.List[str]],
+        'extra': typing.Any,
+        'nickname': typing.Optional[str],
+    }
+    assert typing.get_type_hints(Address) == {'city': str, 'zip_code': typing.Optional[str]}
+    assert typing.get_type_hints(Order) == {'id': int, 'items': typing.Optional[typing.List[Items]]}
+    assert Customer.nickname is None
+
+
+def test_generate_source_models_build_samples():
+    Customer = load(generate_source(SAMPLES[0], snake_case_keys=False, alpha_keys=False))['MyModel']
+
+    customer = Customer(**SAMPLES[0])
+    customer.validate()
+
+    assert customer.fullName == 'John'
+    assert customer.address.city == 'Recife'
+    assert customer.orders[0].items[0].sku == 'a'
+
+
+def test_generate_source_unique_class_names():
+    source = generate_source({'a': {'list': {'x': 1}}, 'b': {'list': {'y': 'a'}}})
+    namespace = load(source)
+
+    assert typing.get_type_hints(namespace['A'])['list'] is namespace['List2']
+    assert typing.get_type_hints(namespace['B'])['list'] is namespace['List3']
+    assert source.index('class List2') < source.index('class A(') < source.index('class MyModel(')
+
+
+def test_generate_source_empty_dicts_and_lists():
+    hints = typing.get_type_hints(load(generate_source({'a': {}, 'b': []}))['MyModel'])
+
+    assert hints == {'a': typing.Optional[dict], 'b': typing.Optional[typing.List[typing.Any]]}
+
+
+@pytest.mark.parametrize('samples', ({}, [1], {'class': 1}, {'1a': 1}))
+def test_generate_source_invalid_samples(samples):
+    with pytest.raises((AssertionError, ValueError)):
+        generate_source(samples)
+
+
+def test_codegen_cli(tmp_path, capsys):
+    samples_path, output_path = tmp_path / 'samples.json', tmp_path / 'models.py'
+    samples_path.write_text(json.dumps(SAMPLES))
+
+    main([str(samples_path), '--class-name', 'Customer', '--output', str(output_path)])
+    main([str(samples_path), '--class-name', 'Customer'])
+
+    assert output_path.read_text() == capsys.readouterr().out
+    assert 'class Customer(Model):' in output_path.read_text()
@@ -0,0 +1,90 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from simple_model import Model
+from simple_model.coercions import _coercions, _coercions_cache, get_coercion, register_coercion
+
+uuid = uuid4()
+
+
+@pytest.mark.parametrize('value, target, expected', (
+    ('2019-07-04T10:20:30', datetime, datetime(2019, 7, 4, 10, 20, 30)),
+    ('2019-07-04T10:20:30Z', datetime, datetime(2019, 7, 4, 10, 20, 30, tzinfo=timezone.utc)),
+    ('2019-07-04', date, date(2019, 7, 4)),
+    ('2019-07-04 10:20:30.5-03:00', datetime,
+     datetime(2019, 7, 4, 10, 20, 30, 500000, tzinfo=timezone(timedelta(hours=-3)))),
+    ('2019-07-04', datetime, datetime(2019, 7, 4)),
+    ('10:20:30', time, time(10, 20, 30)),
+    ('10:20:30.123456+05:30', time, time(10, 20, 30, 123456, tzinfo=timezone(timedelta(hours=5, minutes=30)))),
+    ('10:20', time, time(10, 20)),
+    ('1.1', Decimal, Decimal('1.1')),
+    (1.1, Decimal, Decimal('1.1')),
+    (1, Decimal, Decimal(1)),
+    (str(uuid), UUID, uuid),
+    (uuid.bytes, UUID, uuid),
+    (uuid.int, UUID, uuid),
+))
+def test_coercion(value, target, expected):
+    assert get_coercion(type(value), target)(value) == expected
+
+
+@pytest.mark.parametrize('value, target', (
+    ('2019-7-4', date),
+    ('2019-07-04T', datetime),
+    ('2019-07-04T10:2', datetime),
+    ('10:20:30.1234567', time),
+    ('noon', time),
+))
+def test_coercion_invalid_iso_format(value, target):
+    with pytest.raises(ValueError):
+        get_coercion(str, target)(value)
+
+
+def test_get_coercion_fallback_to_target_type():
+    assert get_coercion(int, str) is str
+
+
+def test_get_coercion_source_subclass():
+    class MyStr(str):
+        pass
+
+    assert get_coercion(MyStr, Decimal) is get_coercion(str, Decimal)
+    assert (MyStr, Decimal) in _coercions_cache
+
+
+def test_register_coercion():
+    class Temperature:
+        def __init__(self, celsius):
+            self.celsius = celsius
+
+    class Reading(Model):
+        temperature: Temperature
+
+    register_coercion(str, Temperature, lambda value: Temperature(float(value.rstrip('C'))))
+    try:
+        reading = Reading(temperature='21.5C')
+        reading.validate()
+    finally:
+        del _coercions[str, Temperature]
+        _coercions_cache.clear()
+
+    assert reading.temperature.celsius == 21.5
+
+
+def test_model_field_coercion():
+    class Event(Model):
+        at: datetime
+        day: date
+        price: Decimal
+        id: UUID
+
+    event = Event(at='2019-07-04T10:20:30', day='2019-07-04', price=1.1, id=str(uuid))
+    event.validate()
+
+    assert event.at == datetime(2019, 7, 4, 10, 20, 30)
+    assert event.day == date(2019, 7, 4)
+    assert event.price == Decimal('1.1')
+    assert event.id == uuid
@@ -0,0 +1,72 @@
+from array import array
+
+import pytest
+
+from simple_model import Model
+from simple_model.columns import from_columns, to_columns
+
+
+class Measure(Model):
+    name: str
+    active: bool
+    count: int
+    value: float
+    unit: str = 'm'
+
+
+@pytest.fixture
+def measures():
+    return [
+        Measure(name='a', active=True, count=1, value=1.5),
+        Measure(name='b', active=False, count=2, value=2.5),
+    ]
+
+
+def test_to_columns(measures):
+    columns = to_columns(measures, use_numpy=False)
+
+    assert set(columns) == {'name', 'active', 'count', 'value', 'unit'}
+    assert columns['name'] == ['a', 'b']
+    assert columns['unit'] == ['m', 'm']
+    assert columns['active'] == array('b', [1, 0])
+    assert columns['count'] == array('q', [1, 2])
+    assert columns['value'] == array('d', [1.5, 2.5])
+
+
+def test_to_columns_fields(measures):
+    assert to_columns(iter(measures), fields=['name']) == {'name': ['a', 'b']}
+
+
+def test_to_columns_empty():
+    assert to_columns([]) == {}
+    assert to_columns([], fields=['name']) == {'name': []}
+
+
+def test_to_columns_numeric_column_with_none(measures):
+    measures[1].count = None
+
+    assert to_columns(measures, fields=['count'], use_numpy=False) == {'count': [1, None]}
+
+
+def test_to_columns_numpy(measures):
+    numpy = pytest.importorskip('numpy')
+
+    columns = to_columns(measures)
+
+    assert columns['count'].dtype == numpy.int64
+    assert columns['value'].dtype == numpy.float64
+    assert columns['active'].dtype == numpy.bool_
+    assert columns['name'] == ['a', 'b']
+    models = from_columns(Measure, columns)
+
+    assert models == measures
+    assert all(type(model.active) is bool for model in models)
+
+
+def test_from_columns(measures):
+    models = from_columns(Measure, to_columns(measures, use_numpy=False))
+
+    assert models == measures
+    assert all(type(model.count) is int for model in models)
+    assert all(type(model.active) is bool for model in models)
+    assert models[0].active is True
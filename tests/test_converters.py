@@ -1,8 +1,14 @@
-from enum import Enum
+import json
+import typing
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum, IntEnum
+from uuid import UUID
 
 import pytest
 
 from simple_model import Model, to_dict
+from simple_model.converters import ModelJSONEncoder
 from tests.conftest import MyModel
 
 
@@ -95,3 +101,99 @@ def test_model_to_dict_attribute_is_enum():
     foo_bar = FooBar(foo='foo', bar=Bar.bar)
     foo_bar.validate()
     assert foo_bar.as_dict() == expected_dict
+
+
+def test_model_to_dict_attribute_is_falsy_int_enum():
+    class Level(IntEnum):
+        low = 0
+        high = 1
+
+    class Foo(Model):
+        level: Level
+
+    foo = Foo(level=Level.low)
+    foo.validate()
+    as_dict = foo.as_dict()
+
+    assert as_dict == {'level': 0}
+    assert type(as_dict['level']) is int
+
+
+class Address(Model):
+    city: str
+    street: str
+
+
+class Customer(Model):
+    name: str
+    address: Address
+    addresses: typing.List[Address]
+    created_at: datetime = None
+
+
+@pytest.fixture
+def customer():
+    address = {'city': 'Recife', 'street': 'A'}
+    customer = Customer(name='John', address=address, addresses=[address, address])
+    customer.validate()
+    return customer
+
+
+def test_model_to_dict_include(customer):
+    assert to_dict(customer, include={'name'}) == {'name': 'John'}
+    assert customer.as_dict(include={'name', 'address__city', 'addresses__street'}) == {
+        'name': 'John',
+        'address': {'city': 'Recife'},
+        'addresses': [{'street': 'A'}, {'street': 'A'}],
+    }
+
+
+def test_model_to_dict_include_whole_nested_field(customer):
+    assert to_dict(customer, include={'address', 'address__city'}) == {
+        'address': {'city': 'Recife', 'street': 'A'},
+    }
+
+
+def test_model_to_dict_exclude(customer):
+    assert to_dict(customer, exclude={'addresses', 'address__street', 'created_at'}) == {
+        'name': 'John',
+        'address': {'city': 'Recife'},
+    }
+    assert 'address' not in to_dict(customer, exclude={'address', 'address__street'})
+
+
+def test_model_to_dict_include_and_exclude(customer):
+    assert to_dict(customer, include={'name', 'address'}, exclude={'address__city'}) == {
+        'name': 'John',
+        'address': {'street': 'A'},
+    }
+
+
+def test_model_to_dict_plan_is_cached(customer):
+    to_dict(customer, include=['name'])
+
+    assert (frozenset({'name'}), None) in Customer._meta.serialization_plans
+    assert to_dict(customer, include={'name'}) == {'name': 'John'}
+
+
+def test_model_json_encoder(customer):
+    customer.created_at = datetime(2019, 7, 4)
+
+    data = json.loads(json.dumps(customer, cls=ModelJSONEncoder, include={'name', 'created_at', 'address__city'}))
+
+    assert data == {'name': 'John', 'created_at': '2019-07-04T00:00:00', 'address': {'city': 'Recife'}}
+
+
+@pytest.mark.parametrize('value, expected', (
+    (Decimal('1.10'), '1.10'),
+    (UUID(int=1), str(UUID(int=1))),
+    (date(2019, 7, 4), '2019-07-04'),
+    ({1}, [1]),
+))
+def test_model_json_encoder_field_types(value, expected):
+    assert json.loads(json.dumps(value, cls=ModelJSONEncoder)) == expected
+
+
+def test_model_json_encoder_invalid_type():
+    with pytest.raises(TypeError):
+        json.dumps(object(), cls=ModelJSONEncoder)
@@ -0,0 +1,147 @@
+import io
+from datetime import date
+from decimal import Decimal
+from enum import Enum, IntEnum
+from typing import Dict, List, Optional
+
+import pytest
+
+from simple_model import Model
+from simple_model.exceptions import EmptyField
+
+
+class Color(Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class Product(Model):
+    name: str
+    active: bool
+    quantity: int
+    price: Decimal
+    released: Optional[date]
+    color: Color = Color.RED
+
+
+CSV = (
+    'name,active,quantity,price,released,color,ignored\r\n'
+    'pen,true,3,1.50,2019-07-04,blue,x\r\n'
+    'ink,No,10,0.25,,,y\r\n'
+)
+
+
+def test_iter_csv():
+    products = list(Product.iter_csv(io.StringIO(CSV)))
+
+    assert products == [
+        Product(name='pen', active=True, quantity=3, price=Decimal('1.50'), released=date(2019, 7, 4),
+                color=Color.BLUE),
+        Product(name='ink', active=False, quantity=10, price=Decimal('0.25'), released=None),
+    ]
+    assert all(product._is_valid for product in products)
+
+
+def test_iter_csv_is_lazy():
+    rows = Product.iter_csv(io.StringIO(CSV + 'bad,maybe,1,1,,,\r\n'))
+
+    assert next(rows).name == 'pen'
+    assert next(rows).name == 'ink'
+    with pytest.raises(ValueError):
+        next(rows)
+
+
+def test_iter_csv_empty_required_field():
+    with pytest.raises(EmptyField):
+        list(Product.iter_csv(io.StringIO('name,active,quantity,price\r\n,true,1,1\r\n')))
+
+    product, = Product.iter_csv(io.StringIO('name,active\r\n,true\r\n'), validate=False)
+    assert product.name is None and not product._is_valid
+
+
+def test_iter_csv_empty_file():
+    assert list(Product.iter_csv(io.StringIO(''))) == []
+
+
+def test_write_csv():
+    products = list(Product.iter_csv(io.StringIO(CSV)))
+    fileobj = io.StringIO()
+
+    assert Product.write_csv(products, fileobj) == 2
+    assert fileobj.getvalue() == (
+        'active,color,name,price,quantity,released\r\n'
+        'True,blue,pen,1.50,3,2019-07-04\r\n'
+        'False,red,ink,0.25,10,\r\n'
+    )
+
+    fileobj.seek(0)
+    assert list(Product.iter_csv(fileobj)) == products
+
+
+def test_write_csv_fields():
+    product = Product(name='pen', active=True, quantity=3, price=Decimal(1), released=None)
+    fileobj = io.StringIO()
+
+    Product.write_csv([product], fileobj, fields=['name'], delimiter=';')
+
+    assert fileobj.getvalue() == 'name\r\npen\r\n'
+
+
+class Level(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class Flag(Enum):
+    ON = True
+    OFF = False
+
+
+class Setting(Model):
+    name: str
+    level: Level
+    flag: Optional[Flag] = None
+
+
+def test_csv_enums_of_other_value_types():
+    settings = [Setting(name='a', level=Level.LOW, flag=Flag.OFF), Setting(name='b', level=Level.HIGH)]
+    fileobj = io.StringIO()
+
+    Setting.write_csv(settings, fileobj)
+
+    assert fileobj.getvalue() == 'flag,level,name\r\nFalse,1,a\r\n,2,b\r\n'
+    fileobj.seek(0)
+    read_settings = list(Setting.iter_csv(fileobj))
+    assert read_settings == settings
+    assert read_settings[0].level is Level.LOW and read_settings[0].flag is Flag.OFF
+
+
+class Dimensions(Model):
+    width: int
+
+
+class Box(Model):
+    name: str
+    tags: Optional[List[str]] = None
+    sizes: Dict[str, int] = None
+    dimensions: Dimensions = None
+
+
+@pytest.mark.parametrize('field', ('tags', 'sizes', 'dimensions'))
+def test_csv_non_flat_fields(field):
+    with pytest.raises(TypeError):
+        list(Box.iter_csv(io.StringIO('name,{}\r\nbox,x\r\n'.format(field))))
+
+    fileobj = io.StringIO()
+    with pytest.raises(TypeError):
+        Box.write_csv([Box(name='box')], fileobj, fields=['name', field])
+    assert fileobj.getvalue() == ''
+
+
+def test_csv_non_flat_fields_not_used():
+    box, = Box.iter_csv(io.StringIO('name\r\nbox\r\n'))
+    fileobj = io.StringIO()
+
+    Box.write_csv([box], fileobj, fields=['name'])
+
+    assert fileobj.getvalue() == 'name\r\nbox\r\n'
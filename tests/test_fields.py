@@ -147,9 +147,63 @@ def test_model_field_convert_to_type_optional(typeless_model_field, value):
 def test_model_field_convert_to_type_union_invalid(typeless_model_field):
     value = {}
     with pytest.raises(AssertionError) as exc_info:
-        typeless_model_field.convert_to_type(None, value, field_class=typing.Union[int, str])
+        typeless_model_field.convert_to_type(None, value, field_class=typing.Union[int, float])
 
-    assert str(exc_info.value) == "Field of type (<class 'int'>, <class 'str'>) received an object of invalid type <class 'dict'>"
+    assert str(exc_info.value) == "Field of type (<class 'int'>, <class 'float'>) received an object of invalid type <class 'dict'>"
+
+
+@pytest.mark.parametrize('field_class, value, expected', (
+    (typing.Union[int, str], 1.5, 1),
+    (typing.Union[str, int], 1.5, '1.5'),
+    (typing.Optional[int], '10', 10),
+    (typing.Union[int, float], True, True),
+))
+def test_model_field_convert_to_type_union_coercion(typeless_model_field, field_class, value, expected):
+    new_value = typeless_model_field.convert_to_type(None, value, field_class=field_class)
+
+    assert new_value == expected
+    assert type(new_value) is type(expected)
+
+
+def test_model_field_convert_to_type_union_dispatch_is_cached(typeless_model_field):
+    field_class = typing.Optional[int]
+
+    assert typeless_model_field.convert_to_type(None, '1', field_class=field_class) == 1
+    assert typeless_model_field._union_dispatch == {(field_class, str): (int, type(None))}
+
+    with pytest.raises(AssertionError):
+        typeless_model_field.convert_to_type(None, 'one', field_class=field_class)
+
+
+def test_model_field_convert_to_type_union_dispatch_keeps_member_order(typeless_model_field):
+    field_class = typing.Union[int, float]
+
+    assert typeless_model_field.convert_to_type(None, '1.5', field_class=field_class) == 1.5
+    value = typeless_model_field.convert_to_type(None, '2', field_class=field_class)
+
+    assert value == 2
+    assert type(value) is int
+
+
+def test_model_field_convert_to_type_optional_generic(typeless_model_field):
+    field_class = typing.Optional[typing.List[MyModel]]
+
+    value = typeless_model_field.convert_to_type(None, [{'foo': 'foo'}], field_class=field_class)
+
+    assert isinstance(value, list)
+    assert isinstance(value[0], MyModel)
+    assert value[0].foo == 'foo'
+
+
+def test_model_field_convert_to_type_union_of_models(typeless_model_field):
+    class OtherModel(Model):
+        baz: str
+
+    field_class = typing.Union[MyModel, OtherModel]
+    model = OtherModel(baz='baz')
+
+    assert typeless_model_field.convert_to_type(None, model, field_class=field_class) is model
+    assert isinstance(typeless_model_field.convert_to_type(None, {}, field_class=field_class), MyModel)
 
 
 def test_model_field_convert_to_type_value_has_correct_type(model_field):
@@ -238,3 +292,137 @@ def test_model_field_convert_to_type_do_nothing_if_field_is_already_of_expected_
     value = MyDateTime(2016, 6, 6)
 
     assert model_field.convert_to_type(None, value) is value
+
+
+def test_model_field_convert_to_type_list_of_dicts_to_models(model_field):
+    model_field._type = typing.List[MyModel]
+    value = [{'foo': 'foo'}, {'foo': 'bar', 'bar': 'baz'}]
+
+    models = model_field.convert_to_type(None, value)
+
+    assert all(type(model) is MyModel for model in models)
+    assert models[0].foo == 'foo'
+    assert models[0].baz is None
+    assert models[1].bar == 'baz'
+
+
+@pytest.mark.parametrize('sequence_type, sequence_class', (
+    (typing.List[MyModel], list),
+    (typing.Tuple[MyModel, ...], tuple),
+))
+def test_model_field_convert_to_type_generator_of_dicts_to_models(model_field, sequence_type, sequence_class):
+    model_field._type = sequence_type
+
+    models = model_field.convert_to_type(None, ({'foo': i} for i in range(3)))
+
+    assert type(models) is sequence_class
+    assert [model.foo for model in models] == [0, 1, 2]
+
+
+def test_model_field_convert_to_type_list_of_dicts_custom_init(model_field):
+    class InitModel(Model):
+        foo: str
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.initialized = True
+
+    model_field._type = typing.List[InitModel]
+
+    models = model_field.convert_to_type(None, [{'foo': 'foo'}])
+
+    assert models[0].initialized is True
+
+
+def test_model_field_validate_list_of_models(model_field, model, model2):
+    model_field._validate = None
+    models = [model, model2]
+
+    assert model_field.validate(None, models) is models
+    assert model._is_valid is True
+    assert model2._is_valid is True
+
+
+def test_model_field_validate_list_of_models_invalid(model_field, model, model2):
+    model2.foo = 'invalid'
+
+    with pytest.raises(ValidationError):
+        model_field.validate(None, [model, model2])
+
+
+@pytest.mark.parametrize('field_type, value, expected', (
+    (typing.Dict[str, int], {1: '1', 2: 2}, {'1': 1, '2': 2}),
+    (typing.Dict[str, int], [('1', '1')], {'1': 1}),
+    (typing.Set[int], ['1', 2, '2'], {1, 2}),
+    (typing.FrozenSet[str], [1, '1'], frozenset({'1'})),
+    (typing.Tuple[int, str], ['1', 2], (1, '2')),
+    (typing.Tuple[int, ...], ['1', 2], (1, 2)),
+    (typing.List[typing.List[int]], [['1'], (2, '3')], [[1], [2, 3]]),
+    (typing.Dict[str, typing.Optional[typing.List[int]]], {'a': ['1'], 'b': None}, {'a': [1], 'b': None}),
+    (dict, {'a': '1'}, {'a': '1'}),
+    (set, {'1'}, {'1'}),
+))
+def test_model_field_convert_to_type_generics(model_field, field_type, value, expected):
+    model_field._type = field_type
+
+    new_value = model_field.convert_to_type(None, value)
+
+    assert new_value == expected
+    assert type(new_value) is type(expected)
+
+
+def test_model_field_convert_to_type_nested_dict_of_models(model_field):
+    model_field._type = typing.Dict[str, typing.List[MyModel]]
+    model = MyModel(foo='foo')
+
+    value = model_field.convert_to_type(None, {'a': [{'foo': 'bar'}, model], 'b': []})
+
+    assert isinstance(value['a'][0], MyModel)
+    assert value['a'][0].foo == 'bar'
+    assert value['a'][1] is model
+    assert value['b'] == []
+
+
+def test_model_field_convert_to_type_fixed_tuple_invalid_length(model_field):
+    model_field._type = typing.Tuple[int, str]
+
+    with pytest.raises(AssertionError):
+        model_field.convert_to_type(None, (1, '2', 3))
+
+
+def test_model_field_convert_to_type_converter_is_compiled_once(model_field):
+    model_field._type = typing.Dict[str, typing.List[int]]
+    model_field.convert_to_type(None, {'a': ['1']})
+    converter = model_field._converters[model_field._type]
+
+    with mock.patch.object(model_field, '_compile') as compile_:
+        assert model_field.convert_to_type(None, {'b': [2]}) == {'b': [2]}
+
+    assert compile_.called is False
+    assert model_field._converters[model_field._type] is converter
+
+
+@pytest.mark.parametrize('type_, value, expected', (
+    (str, 'a', True),
+    (str, None, True),
+    (int, True, False),
+    (typing.Any, object(), True),
+    (typing.List[int], [1, 2], True),
+    (typing.List[int], [1, '2'], False),
+    (typing.Sequence[int], (1, 2), True),
+    (typing.Set[str], {'a'}, True),
+    (typing.FrozenSet[str], {'a'}, False),
+    (typing.Tuple[int, ...], (1, 2), True),
+    (typing.Tuple[int, str], (1, '2'), True),
+    (typing.Tuple[int, str], (1, 2), False),
+    (typing.Dict[str, int], {'a': 1}, True),
+    (typing.Dict[str, int], {1: 1}, False),
+    (typing.Optional[typing.List[int]], [1], True),
+    (typing.Union[int, str], 1.0, False),
+    (MyModel, MyModel(foo='foo'), True),
+    (MyModel, {'foo': 'foo'}, False),
+))
+def test_model_field_check_type(model_field, type_, value, expected):
+    model_field._type = type_
+
+    assert model_field.check_type(value) is expected
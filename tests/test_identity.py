@@ -0,0 +1,130 @@
+import typing
+
+import pytest
+
+from simple_model import Model, model_many_builder
+from simple_model.identity import IdentityConflict, IdentityMap, active_identity_map
+
+
+class Author(Model):
+    id: int
+    name: str
+
+    class Meta:
+        primary_key = 'id'
+
+
+class Tag(Model):
+    name: str
+
+
+class Post(Model):
+    id: int
+    title: str
+    author: Author
+    reviewers: typing.List[Author] = list
+    tags: typing.List[Tag] = list
+
+    class Meta:
+        primary_key = 'id'
+
+
+AUTHOR = {'id': 1, 'name': 'John'}
+PAYLOAD = [
+    {'id': 1, 'title': 'a', 'author': AUTHOR, 'reviewers': [dict(AUTHOR), {'id': 2, 'name': 'Jane'}],
+     'tags': [{'name': 'x'}]},
+    {'id': 2, 'title': 'b', 'author': dict(AUTHOR), 'reviewers': [], 'tags': [{'name': 'x'}]},
+    {'id': 1, 'title': 'a', 'author': AUTHOR, 'reviewers': [dict(AUTHOR), {'id': 2, 'name': 'Jane'}],
+     'tags': [{'name': 'x'}]},
+]
+
+
+def test_build_many_identity_map():
+    identity_map = IdentityMap()
+
+    posts = Post.build_many(PAYLOAD, identity_map=identity_map)
+
+    assert posts[0] is posts[2]
+    assert posts[0].author is posts[1].author is posts[0].reviewers[0]
+    assert isinstance(posts[0].reviewers[1], Author)
+    assert posts[0].tags[0] is not posts[1].tags[0]
+    assert identity_map.get(Author, 1) is posts[0].author
+    assert identity_map.get(Post, 3) is None
+    assert identity_map.hits == 3
+    assert len(identity_map) == 4
+    assert identity_map.conflicts == []
+    assert active_identity_map() is None
+
+    for post in posts:
+        post.validate()
+    assert posts[1].author._is_valid is True
+
+
+def test_build_many_identity_map_conflicts():
+    identity_map = IdentityMap()
+    payload = [
+        {'id': 1, 'title': 'a', 'author': AUTHOR},
+        {'id': 2, 'title': 'b', 'author': {'id': 1, 'name': 'Johnny'}},
+    ]
+
+    posts = Post.build_many(payload, identity_map=identity_map)
+
+    assert posts[0].author is not posts[1].author
+    assert posts[1].author.name == 'Johnny'
+    assert identity_map.conflicts == [IdentityConflict(Author, 1, AUTHOR, {'id': 1, 'name': 'Johnny'})]
+
+
+def test_build_many_without_identity_map():
+    posts = Post.build_many(PAYLOAD)
+    for post in posts:
+        post.validate()
+
+    assert posts[0] is not posts[2]
+    assert posts[0].author is not posts[1].author
+
+
+def test_identity_map_context_manager():
+    identity_map = IdentityMap()
+
+    with identity_map:
+        assert active_identity_map() is identity_map
+        with IdentityMap() as inner:
+            assert active_identity_map() is inner
+        first, second = (Post(id=i, title='a', author=AUTHOR) for i in (1, 2))
+        first.validate()
+        second.validate()
+
+    assert active_identity_map() is None
+    assert first.author is second.author
+
+
+def test_identity_map_none_and_unhashable_primary_keys():
+    identity_map = IdentityMap()
+
+    first = identity_map.resolve(Author, {'id': None, 'name': 'a'})
+    second = identity_map.resolve(Author, {'id': None, 'name': 'a'})
+    third = identity_map.resolve(Author, {'id': [1], 'name': 'a'})
+
+    assert first is not second
+    assert isinstance(third, Author)
+    assert len(identity_map) == 0
+
+
+def test_model_many_builder_identity_map():
+    identity_map = IdentityMap()
+    data = [{'id': 1, 'name': 'John'}, {'id': 1, 'name': 'John'}, {'id': 1, 'name': 'Jim'}]
+
+    first, second, third = model_many_builder(data, cls=Author, identity_map=identity_map)
+
+    assert first is second
+    assert third is not first and third.name == 'Jim'
+    assert len(identity_map.conflicts) == 1
+
+
+def test_primary_key_must_be_a_field():
+    with pytest.raises(AssertionError):
+        class Invalid(Model):
+            name: str
+
+            class Meta:
+                primary_key = 'id'
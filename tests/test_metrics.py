@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from simple_model import Model, model_builder, to_dict
+from simple_model import metrics
+from simple_model.exceptions import ValidationError
+
+
+class Person(Model):
+    name: str
+    age: int
+
+    def validate_age(self, age):
+        if age < 0:
+            raise ValidationError('invalid age')
+        return age
+
+
+@pytest.fixture
+def enabled_metrics():
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+def test_metrics_disabled_by_default():
+    metrics.reset()
+    person = Person(name='John', age=1)
+    person.validate()
+
+    assert metrics.enabled is False
+    assert metrics.snapshot()['instances'] == {}
+
+
+def test_metrics_snapshot(enabled_metrics):
+    person = Person(name='John', age=1)
+    person.validate()
+    person.as_dict()
+    to_dict(person)
+    Person.validate_many([Person(name='Jane', age=2), Person.construct(name='Joe', age=3)])
+    with pytest.raises(ValidationError):
+        Person(name='Jim', age=-1).validate()
+    model_builder({'name': 'John'}, class_name='Built')
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot['instances'] == {('Person',): 4, ('Built',): 1}
+    assert snapshot['validations'] == {('Person',): 4}
+    assert snapshot['validation_failures'] == {('Person', 'age'): 1}
+    assert snapshot['serializations'] == {('Person',): 2}
+    assert snapshot['builder_classes'] == {('Built',): 1}
+
+
+def test_metrics_merges_threads(enabled_metrics):
+    def create():
+        for _ in range(100):
+            Person(name='John', age=1)
+
+    threads = [threading.Thread(target=create) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.snapshot()['instances'] == {('Person',): 400}
+
+
+def test_metrics_reset(enabled_metrics):
+    Person(name='John', age=1)
+    metrics.reset()
+
+    assert metrics.snapshot()['instances'] == {}
+
+
+def test_metrics_render():
+    snapshot = {'instances': {('Person',): 2}, 'validation_failures': {('Person', 'a"b'): 1}}
+
+    text = metrics.render(snapshot)
+
+    assert '# TYPE simple_model_instances_total counter\n' in text
+    assert 'simple_model_instances_total{model="Person"} 2\n' in text
+    assert 'simple_model_validation_failures_total{model="Person",field="a\\"b"} 1\n' in text
+    assert not text.endswith('# EOF\n')
+
+
+def test_metrics_render_openmetrics(enabled_metrics):
+    Person(name='John', age=1)
+
+    text = metrics.render(openmetrics=True)
+
+    assert '# TYPE simple_model_instances counter\n' in text
+    assert 'simple_model_instances_total{model="Person"} 1\n' in text
+    assert text.endswith('# EOF\n')
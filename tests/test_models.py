@@ -1,12 +1,19 @@
+import json
+import pickle
 import pytest
+import sys
+import threading
+import time
 import typing
+from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest import mock
 
 from simple_model import Model, to_dict
-from simple_model.exceptions import EmptyField, ValidationError
+from simple_model.exceptions import EmptyField, FrozenInstanceError, StrictTypeError, ValidationError
 from simple_model.fields import ModelField
-from simple_model.models import LazyModel
+from simple_model.models import LazyModel, _intern_key
 
 from .conftest import MyModel
 
@@ -29,6 +36,14 @@ class TypedModel(Model):
     string: str = 'foobar'  # type constraint + default
 
 
+class FrozenModel(Model):
+    foo: str
+    bar: int
+
+    class Meta:
+        frozen = True
+
+
 class TypelessModel(Model):
     boolean = True
     number = 1.0
@@ -817,3 +832,819 @@ def test_model_super_validate_is_called():
 
     with pytest.raises(ValidationError):
         model.validate()
+
+
+def test_model_is_not_hashable(model):
+    with pytest.raises(TypeError):
+        hash(model)
+    assert not isinstance(model, Hashable)
+
+
+def test_frozen_model_subclass_hash():
+    class FrozenSubModel(FrozenModel):
+        pass
+
+    class MutableSubModel(FrozenModel):
+        class Meta:
+            frozen = False
+
+    model, other_model = FrozenSubModel(foo='foo', bar=1), FrozenSubModel(foo='foo', bar=1)
+    model.validate()
+    other_model.validate()
+
+    assert isinstance(model, Hashable)
+    assert hash(model) == hash(other_model)
+    assert not isinstance(MutableSubModel(foo='foo', bar=1), Hashable)
+
+
+def test_frozen_model_hash():
+    model = FrozenModel(foo='foo', bar='1')
+    model.validate()
+    other_model = FrozenModel(foo='foo', bar=1)
+    other_model.validate()
+
+    assert set(model._frozen_values) == {'foo', 1}
+    assert hash(model) == hash(other_model)
+    assert model == other_model
+    assert len({model, other_model}) == 1
+
+
+def test_frozen_model_hash_not_validated():
+    model = FrozenModel(foo='foo', bar=1)
+
+    with pytest.raises(AssertionError):
+        hash(model)
+
+
+def test_frozen_model___eq___not_equals():
+    model = FrozenModel(foo='foo', bar=1)
+    model.validate()
+    other_model = FrozenModel(foo='foo', bar=2)
+    other_model.validate()
+
+    assert model != other_model
+    assert model == {'foo': 'foo', 'bar': 1}
+
+
+def test_frozen_model_rejects_mutation_after_validation():
+    model = FrozenModel(foo='foo', bar=1)
+    model.bar = 2
+    model.validate()
+
+    with pytest.raises(FrozenInstanceError) as exc:
+        model.bar = 3
+
+    assert model.bar == 2
+    assert "'bar'" in str(exc.value)
+    model._private = 'private'
+
+
+def test_frozen_model_validate_is_not_repeated():
+    model = FrozenModel(foo='foo', bar=1)
+    model.validate()
+    model.convert_fields = mock.Mock()
+
+    assert model.validate(raise_exception=False) is True
+    assert model.convert_fields.called is False
+
+
+def test_frozen_model_inheritance():
+    class SubFrozenModel(FrozenModel):
+        baz: str = 'baz'
+
+    model = SubFrozenModel(foo='foo', bar=1)
+    model.validate()
+
+    assert SubFrozenModel._meta.frozen is True
+    assert 'Meta' not in SubFrozenModel._meta.fields
+    with pytest.raises(FrozenInstanceError):
+        model.baz = 'qux'
+
+
+def test_frozen_lazy_model_rejects_mutation_after_validation():
+    class FooModel(LazyModel):
+        foo: str
+
+        class Meta:
+            frozen = True
+
+    model = FooModel(foo='foo')
+    assert model.foo == 'foo'
+
+    with pytest.raises(FrozenInstanceError):
+        model.foo = 'bar'
+
+    assert model._is_valid is True
+
+
+class Currency(Model):
+    code: str
+
+    class Meta:
+        frozen = True
+        intern = True
+
+
+class Price(Model):
+    amount: float
+    currency: Currency
+    currencies: typing.List[Currency] = list
+
+
+def test_interned_model_intern():
+    currency = Currency(code='BRL')
+    other_currency = Currency(code='BRL')
+
+    assert currency.intern() is currency
+    assert other_currency.intern() is currency
+    assert other_currency._is_valid is True
+    assert Currency(code='USD').intern() is not currency
+
+
+def test_interned_model_nested_fields_are_shared():
+    prices = [
+        Price(amount=1, currency={'code': 'BRL'}, currencies=[{'code': 'BRL'}, {'code': 'USD'}]),
+        Price(amount=2, currency={'code': 'BRL'}, currencies=[{'code': 'BRL'}]),
+    ]
+    for price in prices:
+        price.validate()
+
+    assert prices[0].currency is prices[1].currency
+    assert prices[0].currencies[0] is prices[0].currency
+    assert prices[1].currencies[0] is prices[0].currency
+    assert prices[0].currencies[1].code == 'USD'
+
+
+def test_interned_model_table_is_weak():
+    Currency(code='EUR').intern()
+
+    assert _intern_key(('EUR',)) not in Currency._meta.intern_table
+
+
+class Tag(Model):
+    value: typing.Any
+    values: typing.Tuple[typing.Any, ...] = ()
+
+    class Meta:
+        frozen = True
+        intern = True
+
+
+def test_interned_model_values_types_are_part_of_key():
+    tag = Tag(value=1)
+    tag.intern()
+
+    float_tag = Tag(value=1.0)
+    assert float_tag.intern() is float_tag
+    assert type(float_tag.value) is float
+    assert Tag(value=True).intern().value is True
+    assert Tag(value=1).intern() is tag
+
+    int_values_tag = Tag(value=1, values=(1,))
+    int_values_tag.intern()
+    float_values_tag = Tag(value=1, values=(1.0,))
+    assert float_values_tag.intern() is float_values_tag
+
+
+def test_interned_model_must_be_frozen():
+    with pytest.raises(AssertionError):
+        class InternedModel(Model):
+            foo: str
+
+            class Meta:
+                intern = True
+
+
+def test_model_intern_requires_intern_option(model):
+    with pytest.raises(AssertionError):
+        model.intern()
+
+
+class Address(Model):
+    city: str
+    street: str
+
+    def validate_city(self, city):
+        return city.strip()
+
+
+class Customer(Model):
+    name: str
+    age: int
+    address: Address
+    tags: typing.List[str] = list
+
+
+def test_model_replace():
+    customer = Customer(name='John', age=42, address={'city': 'Recife', 'street': 'A'}, tags=['a'])
+    customer.validate()
+
+    new_customer = customer.replace(age='43')
+
+    assert new_customer is not customer
+    assert new_customer._is_valid is True
+    assert new_customer.age == 43
+    assert new_customer.address is customer.address
+    assert new_customer.tags is customer.tags
+    assert customer.age == 42
+
+
+def test_model_replace_only_validates_changed_fields():
+    customer = Customer(name='John', age=42, address={'city': 'Recife', 'street': 'A'})
+    customer.validate()
+
+    with mock.patch.object(Address, 'validate') as validate:
+        new_customer = customer.replace(name='Jane')
+
+    assert validate.called is False
+    assert new_customer.name == 'Jane'
+
+
+def test_model_replace_nested():
+    customer = Customer(name='John', age=42, address={'city': 'Recife', 'street': 'A'})
+    customer.validate()
+
+    new_customer = customer.replace(address__city=' Olinda ', name='Jane')
+
+    assert new_customer.name == 'Jane'
+    assert new_customer.address.city == 'Olinda'
+    assert new_customer.address.street == 'A'
+    assert new_customer.address is not customer.address
+    assert customer.address.city == 'Recife'
+
+
+def test_model_replace_not_validated():
+    customer = Customer(name='John', age='42')
+
+    new_customer = customer.replace(name='Jane')
+
+    assert new_customer._is_valid is False
+    assert new_customer.age == '42'
+
+
+def test_model_replace_invalid_value():
+    customer = Customer(name='John', age=42, address={'city': 'Recife', 'street': 'A'})
+    customer.validate()
+
+    with pytest.raises(EmptyField):
+        customer.replace(name='')
+
+
+def test_model_replace_unknown_field(model):
+    with pytest.raises(TypeError):
+        model.replace(foo='foo', unknown='unknown')
+
+
+def test_model_replace_validates_properties():
+    class Foo(Model):
+        a: float
+        c: float
+
+        @property
+        def c(self):
+            return self.a * 2
+
+        def validate_c(self, c):
+            if c < 0:
+                raise ValidationError()
+            return c
+
+    foo = Foo(a=1)
+    foo.validate()
+
+    with pytest.raises(ValidationError):
+        foo.replace(a=-1)
+
+
+def test_frozen_model_replace():
+    model = FrozenModel(foo='foo', bar=1)
+    model.validate()
+
+    new_model = model.replace(bar=2)
+
+    other_model = FrozenModel(foo='foo', bar=2)
+    other_model.validate()
+
+    assert new_model.bar == 2
+    assert new_model != model
+    assert new_model == other_model
+    assert hash(new_model) == hash(other_model)
+
+
+def test_model_post_init_is_called_on_nested_lists():
+    class Child(Model):
+        foo: str
+
+        def __post_init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    class Parent(Model):
+        children: typing.List[Child]
+
+    parent = Parent(children=[{'foo': 'foo'}])
+    parent.validate()
+
+    assert parent.children[0].kwargs == {'foo': 'foo'}
+
+
+def test_validate_many(model, model2):
+    assert MyModel.validate_many([model, model2]) is None
+    assert model._is_valid is True
+    assert model2._is_valid is True
+
+
+def test_validate_many_invalid(model, model2):
+    model2.foo = ''
+
+    assert MyModel.validate_many([model, model2], raise_exception=False) is False
+    assert model2._is_valid is False
+    with pytest.raises(EmptyField):
+        MyModel.validate_many([model, model2])
+
+
+def test_validate_many_different_classes(model):
+    with pytest.raises(AssertionError):
+        FooBarModel.validate_many([model])
+
+
+class LazyCustomer(Model):
+    name: str
+    address: Address
+    billing_address: Address = None
+
+    class Meta:
+        lazy_nested = True
+
+
+def test_lazy_nested_model_is_built_on_access():
+    address = {'city': ' Recife ', 'street': 'A'}
+    customer = LazyCustomer(name='John', address=address)
+    customer.validate()
+
+    assert customer.__dict__['address'] is address
+
+    assert isinstance(customer.address, Address)
+    assert customer.address.city == 'Recife'
+    assert customer.address._is_valid is True
+    assert customer.address is customer.address
+    assert customer.billing_address is None
+
+
+def test_lazy_nested_model_validation_on_access():
+    customer = LazyCustomer(name='John', address={'city': 'Recife'})
+    customer.validate()
+
+    with pytest.raises(EmptyField):
+        customer.address
+
+
+def test_lazy_nested_model_as_dict_keeps_dict():
+    address = {'city': ' Recife ', 'street': 'A'}
+    customer = LazyCustomer(name='John', address=address)
+    customer.validate()
+
+    as_dict = customer.as_dict()
+
+    assert as_dict['address'] is address
+    assert as_dict['billing_address'] is None
+    assert isinstance(customer.__dict__['address'], dict)
+
+
+def test_lazy_nested_model_as_dict_after_access():
+    customer = LazyCustomer(name='John', address={'city': ' Recife ', 'street': 'A'})
+    customer.validate()
+    customer.address
+
+    assert customer.as_dict()['address'] == {'city': 'Recife', 'street': 'A'}
+
+
+def test_lazy_nested_model_accepts_models():
+    address = Address(city='Recife', street='A')
+    customer = LazyCustomer(name='John', address=address)
+    customer.validate()
+
+    assert customer.address is address
+    assert address._is_valid is True
+
+
+def test_lazy_nested_model_inheritance():
+    class SubLazyCustomer(LazyCustomer):
+        age: int = 0
+
+    customer = SubLazyCustomer(name='John', address={'city': 'Recife', 'street': 'A'})
+
+    assert SubLazyCustomer._meta.lazy_fields == {'address', 'billing_address'}
+    assert SubLazyCustomer._meta.descriptors['billing_address'].default_value is None
+    assert customer.address.city == 'Recife'
+
+
+def test_lazy_nested_model_class_attribute():
+    assert LazyCustomer.billing_address is None
+    assert not hasattr(LazyCustomer, 'address')
+
+
+def test_lazy_nested_model_cannot_be_frozen():
+    with pytest.raises(AssertionError):
+        class FrozenLazyModel(Model):
+            address: Address
+
+            class Meta:
+                frozen = True
+                lazy_nested = True
+
+
+class Post(Model):
+    title: str
+    tags: typing.List[str] = list
+    views: int = 0
+
+    def __post_init__(self, **kwargs):
+        self.title = self.title.title()
+
+
+def test_model_construct():
+    post = Post.construct(title='not converted', views='10')
+
+    assert post.title == 'not converted'
+    assert post.views == '10'
+    assert post.tags == []
+    assert post._is_valid is True
+    assert post.as_dict() == {'title': 'not converted', 'tags': [], 'views': '10'}
+
+
+def test_model_construct_many():
+    posts = Post.construct_many([{'title': 'a', 'views': 1}, {'title': 'b', 'tags': ['x']}])
+
+    assert [post.as_dict() for post in posts] == [
+        {'title': 'a', 'tags': [], 'views': 1},
+        {'title': 'b', 'tags': ['x'], 'views': 0},
+    ]
+    assert posts[0].tags is not posts[1].tags
+
+
+def test_model_construct_frozen():
+    class FrozenPost(Model):
+        title: str
+
+        class Meta:
+            frozen = True
+
+    post = FrozenPost.construct(title='a')
+
+    assert hash(post) == hash(FrozenPost.construct(title='a'))
+    with pytest.raises(FrozenInstanceError):
+        post.title = 'b'
+
+
+class StrictAddress(Model):
+    city: str
+
+    class Meta:
+        strict = True
+
+
+class StrictCustomer(Model):
+    name: str
+    tags: typing.List[str] = list
+    scores: typing.Dict[str, float] = dict
+    point: typing.Tuple[int, int] = None
+    nickname: typing.Optional[str] = None
+    address: StrictAddress = None
+    addresses: typing.List[StrictAddress] = list
+
+    class Meta:
+        strict = True
+
+
+def test_model_validate_strict_keeps_values():
+    tags, scores, addresses = ['a'], {'x': 1.0}, [StrictAddress(city='Recife')]
+    customer = StrictCustomer(name='John', tags=tags, scores=scores, point=(1, 2), addresses=addresses,
+                              address=StrictAddress(city='Olinda'))
+
+    customer.validate()
+
+    assert customer._is_valid is True
+    assert customer.tags is tags
+    assert customer.scores is scores
+    assert customer.addresses is addresses
+    assert addresses[0]._is_valid is True
+    assert customer.address._is_valid is True
+
+
+@pytest.mark.parametrize('field_name, value', (
+    ('name', 1),
+    ('tags', ('a',)),
+    ('tags', ['a', 1]),
+    ('scores', {'x': 1}),
+    ('point', (1,)),
+    ('point', (1, '2')),
+    ('nickname', b'john'),
+    ('address', {'city': 'Recife'}),
+    ('addresses', [{'city': 'Recife'}]),
+))
+def test_model_validate_strict_invalid(field_name, value):
+    customer = StrictCustomer(**{'name': 'John', field_name: value})
+
+    with pytest.raises(StrictTypeError) as exc_info:
+        customer.validate()
+
+    assert exc_info.value.field_name == field_name
+    assert customer._is_valid is False
+    assert getattr(customer, field_name) is value
+    assert customer.validate(raise_exception=False) is False
+
+
+def test_model_validate_strict_nested_models():
+    customer = StrictCustomer(name='John', addresses=[StrictAddress(city=1)])
+
+    with pytest.raises(StrictTypeError):
+        customer.validate()
+
+
+def test_model_validate_strict_per_call():
+    model = FooBarModel(foo=1, bar='bar')
+
+    with pytest.raises(StrictTypeError):
+        model.validate(strict=True)
+
+    model.validate()
+    assert model.foo == '1'
+
+    assert StrictAddress(city=1).validate(raise_exception=False, strict=False) is True
+    assert FooBarModel.validate_many([FooBarModel(foo=1, bar='bar')], raise_exception=False, strict=True) is False
+
+
+def test_model_validate_many_strict():
+    addresses = [StrictAddress(city='Recife'), StrictAddress(city=1)]
+
+    with pytest.raises(StrictTypeError):
+        StrictAddress.validate_many(addresses)
+
+    assert addresses[1].city == 1
+    assert StrictAddress.validate_many(addresses, strict=False) is None
+    assert addresses[1].city == '1'
+
+
+class Branch(Model):
+    name: str
+    head: Address = None
+    addresses: typing.List[Address] = list
+    others: typing.List[typing.Any] = list
+
+
+def test_model_validate_skips_clean_nested_models():
+    address = Address(city='Recife', street='A')
+    addresses = [Address(city='Olinda', street='B'), Address(city='Paulista', street='C')]
+    others = [Address(city='Igarassu', street='D'), 1]
+    Address.validate_many([address, *addresses, others[0]])
+    branch = Branch(name='main', head=address, addresses=addresses, others=others)
+
+    with mock.patch.object(Address, 'validate_city') as validate_city:
+        branch.validate()
+
+    assert validate_city.called is False
+    assert branch._is_valid is True
+
+
+def test_model_validate_revalidates_changed_nested_models():
+    address = Address(city='Recife', street='A')
+    addresses = [Address(city='Olinda', street='B')]
+    branch = Branch(name='main', head=address, addresses=addresses)
+    branch.validate()
+
+    address.city = ' Jaboatão '
+    addresses[0].city = ' Paulista '
+    branch.validate()
+
+    assert address.city == 'Jaboatão'
+    assert addresses[0].city == 'Paulista'
+
+
+def test_model_validate_revalidates_invalid_nested_models():
+    address = Address(city='Recife', street='A')
+    address.validate()
+    address.__dict__['city'] = None
+    with pytest.raises(EmptyField):
+        address.validate()
+
+    with pytest.raises(EmptyField):
+        Branch(name='main', head=address).validate()
+
+
+class Region(Model):
+    branches: typing.Dict[str, typing.List[Address]] = dict
+    grid: typing.List[typing.List[Address]] = list
+
+
+def test_model_validate_nested_models_in_containers():
+    region = Region(
+        branches={'pe': [{'city': ' Recife ', 'street': 'A'}]},
+        grid=[[{'city': ' Olinda ', 'street': 'B'}]],
+    )
+    region.validate()
+
+    assert region.branches['pe'][0].city == 'Recife'
+    assert region.grid[0][0].city == 'Olinda'
+    assert region.as_dict() == {
+        'branches': {'pe': [{'city': 'Recife', 'street': 'A'}]},
+        'grid': [[{'city': 'Olinda', 'street': 'B'}]],
+    }
+
+
+class Wallet(Model):
+    currencies: typing.Set[Currency] = set
+    frozen_currencies: typing.FrozenSet[Currency] = frozenset
+
+
+def test_model_as_dict_nested_models_in_sets():
+    currency = Currency(code='BRL')
+    currency.validate()
+    wallet = Wallet(currencies={currency}, frozen_currencies=frozenset({currency}))
+    wallet.validate()
+
+    as_dict = wallet.as_dict()
+
+    assert as_dict == {'currencies': [{'code': 'BRL'}], 'frozen_currencies': [{'code': 'BRL'}]}
+    assert json.loads(json.dumps(as_dict)) == as_dict
+    assert wallet.as_dict(include={'currencies__code'}) == {'currencies': [{'code': 'BRL'}]}
+
+
+class CheckedAddress(Model):
+    city: str
+
+    def validate_city(self, city):
+        if city.isdigit():
+            raise ValidationError('invalid city')
+
+
+class CheckedRegion(Model):
+    branches: typing.Dict[str, typing.List[CheckedAddress]] = dict
+    grid: typing.List[typing.List[CheckedAddress]] = list
+
+
+@pytest.mark.parametrize('changes', (
+    {'branches': {'pe': [{'city': '123'}]}},
+    {'grid': [[{'city': '123'}]]},
+))
+def test_model_validate_invalid_nested_models_in_containers(changes):
+    region = CheckedRegion(**changes)
+
+    with pytest.raises(ValidationError):
+        region.validate()
+    assert region._is_valid is False
+
+
+def test_model_validate_skips_clean_nested_models_in_containers():
+    address = Address(city='Recife', street='A')
+    address.validate()
+    region = Region(branches={'pe': [address]}, grid=[[address]])
+
+    with mock.patch.object(Address, 'validate') as validate:
+        region.validate()
+
+    assert validate.called is False
+    assert region._is_valid is True
+
+
+def test_model_is_clean():
+    address = Address(city='Recife', street='A')
+    assert address._is_clean() is False
+
+    address.validate()
+    assert address._is_clean() is True
+
+    Address(city='Olinda', street='B').street = 'C'  # any model change
+    assert address._is_clean() is False
+
+
+@pytest.fixture
+def fast_thread_switching():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class LazyCounter(LazyModel):
+    number: int
+    numbers: typing.List[int] = list
+
+    def validate_numbers(self, numbers):
+        time.sleep(0)  # switches threads while validating
+        return numbers
+
+
+def test_lazy_model_concurrent_reads_and_writes(fast_thread_switching):
+    counter = LazyCounter(number='0', numbers=['0'])
+    invalid_values = []
+
+    def write():
+        for i in range(300):
+            counter.number = str(i)
+            counter.numbers = [str(i)] * 3
+
+    def read():
+        for _ in range(300):
+            number, numbers = counter.number, counter.numbers
+            if type(number) is not int or any(type(n) is not int for n in numbers):
+                invalid_values.append((number, numbers))
+
+    threads = [threading.Thread(target=target) for target in (write, write, read, read, read, read)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert invalid_values == []
+    assert type(counter.number) is int
+
+
+def test_lazy_model_read_waits_for_write_in_progress():
+    counter = LazyCounter(number='1')
+    counter.validate()
+    values = []
+    reader = threading.Thread(target=lambda: values.append(counter.number))
+
+    # a write in progress, before the model is invalidated
+    with counter._get_lock():
+        counter.__dict__['_version'] = 1
+        counter.__dict__['number'] = '2'
+        reader.start()
+        reader.join(timeout=0.05)
+        assert reader.is_alive()
+
+        counter._is_valid = False
+        counter.__dict__['_version'] = 2
+
+    reader.join()
+    assert values == [2]
+
+
+def test_lazy_model_concurrent_as_dict_and_writes(fast_thread_switching):
+    counter = LazyCounter(number='0', numbers=['0'])
+    invalid_values = []
+
+    def write():
+        for i in range(300):
+            counter.numbers = [str(i)] * 3
+
+    def read():
+        for _ in range(300):
+            numbers = counter.as_dict()['numbers']
+            if any(type(n) is not int for n in numbers):
+                invalid_values.append(numbers)
+
+    threads = [threading.Thread(target=target) for target in (write, write, read, read)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert invalid_values == []
+
+
+def test_lazy_model_pickle():
+    counter = LazyCounter(number='1')
+    counter.number = '2'
+
+    loaded = pickle.loads(pickle.dumps(counter))
+
+    assert loaded.number == 2
+
+
+def test_validate_many_executor(fast_thread_switching):
+    models = [FooBarModel(foo=' {} '.format(i), bar=i) for i in range(1000)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert FooBarModel.validate_many(models, executor=executor, chunk_size=64) is None
+
+    assert all(model._is_valid for model in models)
+    assert [model.foo for model in models] == [str(i) for i in range(1000)]
+    assert models[10].bar == '10'
+
+
+def test_validate_many_executor_invalid():
+    models = [FooBarModel(foo='foo', bar='bar') for _ in range(10)]
+    models[7].bar = None
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(EmptyField):
+            FooBarModel.validate_many(models, executor=executor, chunk_size=3)
+
+        assert FooBarModel.validate_many(models, raise_exception=False, executor=executor, chunk_size=3) is False
+        assert FooBarModel.validate_many([], raise_exception=False, executor=executor) is True
+
+
+def test_intern_concurrently(fast_thread_switching):
+    class Point(Model):
+        x: int
+        y: int
+
+        class Meta:
+            frozen = True
+            intern = True
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        points = list(executor.map(lambda i: Point(x=i % 10, y=0).intern(), range(2000)))
+
+    assert len({id(point) for point in points}) == 10
@@ -0,0 +1,92 @@
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum, IntEnum
+from uuid import uuid4
+
+import pytest
+
+from simple_model import Model
+from simple_model.serializers import _serializers, _serializers_cache, get_serializer, register_serializer, serialize
+
+
+class Color(Enum):
+    red = 'red'
+    blue = 'blue'
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+@pytest.fixture
+def point_serializer():
+    register_serializer(Point, lambda point: (point.x, point.y))
+    yield
+    del _serializers[Point]
+    _serializers_cache.clear()
+
+
+@pytest.mark.parametrize('value', (1, 1.5, 'foo', b'foo', True, None, datetime(2019, 7, 4), Decimal('1.5'), uuid4()))
+def test_serialize_scalars(value):
+    assert serialize(value) is value
+
+
+def test_serialize_enum():
+    assert serialize(Color.red) == 'red'
+
+
+def test_serialize_int_enum():
+    class Level(IntEnum):
+        low = 0
+        high = 1
+
+    assert type(serialize(Level.low)) is int
+    assert serialize(Level.high) == 1
+
+
+@pytest.mark.parametrize('iterable', (list, tuple))
+def test_serialize_iterable(iterable):
+    assert serialize(iterable([Color.red, 1, (Color.blue,)])) == ['red', 1, ['blue']]
+
+
+@pytest.mark.parametrize('iterable', (set, frozenset))
+def test_serialize_set(iterable):
+    assert serialize(iterable([Color.red])) == ['red']
+
+
+def test_serialize_dict():
+    assert serialize({'a': Color.red, 'b': [Color.blue]}) == {'a': 'red', 'b': ['blue']}
+
+
+def test_serialize_model(model):
+    model.validate()
+
+    assert serialize(model) == model.as_dict()
+
+
+def test_get_serializer_is_cached_by_type():
+    class MyStr(str):
+        pass
+
+    serializer = get_serializer(MyStr)
+
+    assert serializer is get_serializer(str)
+    assert _serializers_cache[MyStr] is serializer
+
+
+def test_register_serializer(point_serializer):
+    assert serialize(Point(1, 2)) == (1, 2)
+    assert serialize([Point(1, 2)]) == [(1, 2)]
+
+
+def test_register_serializer_on_model_to_dict(point_serializer):
+    class Shape(Model):
+        name: str
+        points: list
+
+    shape = Shape(name='line', points=[Point(0, 0), Point(1, 1)])
+    shape.validate()
+
+    assert shape.as_dict() == {'name': 'line', 'points': [(0, 0), (1, 1)]}
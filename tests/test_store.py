@@ -0,0 +1,85 @@
+import typing
+
+import pytest
+
+from simple_model import Model
+from simple_model.binary import SchemaMismatch
+from simple_model.store import ModelStore
+
+
+class Item(Model):
+    id: int
+    name: str
+    tags: typing.List[str] = list
+
+
+@pytest.fixture
+def items():
+    items = [Item(id=i, name='item {}'.format(i), tags=['tag'] * (i % 3)) for i in range(50)]
+    for item in items:
+        item.validate()
+    return items
+
+
+@pytest.fixture
+def store_path(tmp_path, items):
+    path = str(tmp_path / 'items.db')
+    ModelStore.write(path, Item, items)
+    return path
+
+
+def test_model_store_write(tmp_path, items):
+    assert ModelStore.write(str(tmp_path / 'items.db'), Item, iter(items)) == len(items)
+
+
+def test_model_store_getitem(store_path, items):
+    with ModelStore(store_path, Item) as store:
+        assert len(store) == len(items)
+        assert store[0] == items[0]
+        assert store[42] == items[42]
+        assert store[-1] == items[-1]
+        assert store[42]._is_valid is True
+
+
+def test_model_store_getitem_out_of_range(store_path, items):
+    with ModelStore(store_path, Item) as store:
+        with pytest.raises(IndexError):
+            store[len(items)]
+
+        with pytest.raises(IndexError):
+            store[-len(items) - 1]
+
+
+def test_model_store_iter(store_path, items):
+    with ModelStore(store_path, Item) as store:
+        assert list(store) == items
+        assert len(store._cache) == 0
+
+
+def test_model_store_cache(store_path):
+    with ModelStore(store_path, Item, cache_size=2) as store:
+        first = store[0]
+        store[1]
+        assert store[0] is first
+
+        store[2]
+        assert list(store._cache) == [0, 2]
+        assert store[1] is not None
+        assert list(store._cache) == [2, 1]
+
+
+def test_model_store_empty(tmp_path):
+    path = str(tmp_path / 'items.db')
+    ModelStore.write(path, Item, [])
+
+    with ModelStore(path, Item) as store:
+        assert len(store) == 0
+        assert list(store) == []
+
+
+def test_model_store_schema_mismatch(store_path):
+    class Other(Model):
+        id: int
+
+    with pytest.raises(SchemaMismatch):
+        ModelStore(store_path, Other)
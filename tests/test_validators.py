@@ -0,0 +1,104 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from simple_model import Model
+from simple_model.exceptions import ValidationError
+from simple_model.validators import pure_validator
+
+
+def build_model(maxsize=2):
+    calls = []
+
+    class Document(Model):
+        number: Any
+
+        @pure_validator(maxsize=maxsize)
+        def validate_number(self, number):
+            calls.append(number)
+            if number == 'invalid':
+                raise ValidationError('invalid number')
+            return number.strip() if isinstance(number, str) else number
+
+    return Document, calls
+
+
+def test_pure_validator_memoizes_by_value():
+    Document, calls = build_model()
+    documents = [Document(number=' 123 ') for _ in range(3)]
+
+    for document in documents:
+        document.validate()
+
+    assert [document.number for document in documents] == ['123'] * 3
+    assert calls == [' 123 ']
+    assert Document.validate_number.cache_info() == (2, 1, 2, 1)
+    assert 'number' in Document._meta.fields and 'validate_number' not in Document._meta.fields
+
+
+def test_pure_validator_value_type_is_part_of_key():
+    Document, calls = build_model()
+
+    Document(number=1).validate()
+    Document(number=True).validate()
+
+    assert calls == [1, True]
+
+
+@pytest.mark.parametrize('first, second', ((Decimal('1.0'), Decimal('1.00')), (0.0, -0.0)))
+def test_pure_validator_keeps_equal_values(first, second):
+    Document, calls = build_model()
+    Document(number=first).validate()
+
+    document = Document(number=second)
+    document.validate()
+
+    assert document.number is second
+    assert calls == [first]
+
+
+def test_pure_validator_lru_eviction():
+    Document, calls = build_model(maxsize=2)
+
+    for number in ('a', 'b', 'a', 'c', 'b'):
+        Document(number=number).validate()
+
+    assert calls == ['a', 'b', 'c', 'b']
+    assert Document.validate_number.cache_info().currsize == 2
+
+
+def test_pure_validator_does_not_cache_errors_nor_unhashable_values():
+    Document, calls = build_model()
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            Document(number='invalid').validate()
+        Document(number=['unhashable']).validate()
+
+    assert calls == ['invalid', ['unhashable']] * 2
+    assert Document.validate_number.cache_info().currsize == 0
+
+
+def test_pure_validator_cache_clear():
+    Document, calls = build_model()
+    Document(number='a').validate()
+
+    Document.validate_number.cache_clear()
+    Document(number='a').validate()
+
+    assert calls == ['a', 'a']
+    assert Document.validate_number.cache_info() == (0, 1, 2, 1)
+
+
+def test_pure_validator_without_arguments():
+    class Document(Model):
+        number: str
+
+        @pure_validator
+        def validate_number(self, number):
+            return number
+
+    Document(number='a').validate()
+
+    assert Document.validate_number.cache_info().maxsize == 1024
@@ -0,0 +1,176 @@
+import typing
+
+import pytest
+
+from simple_model import Model
+from simple_model.exceptions import EmptyField, ValidationError
+from simple_model.views import ModelView
+
+
+class Address(Model):
+    city: str
+    street: str = ''
+
+
+class Person(Model):
+    name: str
+    age: int
+    address: Address = None
+    tags: typing.List[str] = list
+
+    def validate_name(self, name):
+        if self.is_blocked(name):
+            raise ValidationError()
+        return name
+
+    def is_blocked(self, name):
+        return name == 'blocked'
+
+
+@pytest.fixture
+def person_data():
+    return {'name': 'John', 'age': 18, 'address': {'city': 'Recife', 'street': 'A'}, 'tags': ['a']}
+
+
+def test_model_view(person_data):
+    view = Person.view(person_data)
+
+    assert isinstance(view, ModelView)
+    assert view.model_class is Person
+    assert view.mapping is person_data
+    assert view.name == 'John'
+    assert view.age == 18
+    assert view.tags is person_data['tags']
+    assert isinstance(view.address, ModelView)
+    assert view.address.city == 'Recife'
+    assert 'Person.view(' in repr(view)
+
+
+def test_model_view_conversion_on_access():
+    view = Person.view({'name': 'John', 'age': '18'})
+
+    assert view.age == 18
+    assert view.address is None
+    assert view.tags == []
+
+
+def test_model_view_is_read_only(person_data):
+    view = Person.view(person_data)
+
+    with pytest.raises(AttributeError):
+        view.name = 'Jane'
+
+
+def test_model_view_unknown_attribute(person_data):
+    view = Person.view(person_data)
+
+    with pytest.raises(AttributeError):
+        view.unknown
+
+
+def test_model_view_validate(person_data):
+    view = Person.view(person_data)
+
+    assert view.validate() is None
+    assert view._is_valid is True
+
+
+def test_model_view_validate_invalid(person_data):
+    person_data['name'] = 'blocked'
+    view = Person.view(person_data)
+
+    assert view.validate(raise_exception=False) is False
+    with pytest.raises(ValidationError):
+        view.validate()
+
+
+def test_model_view_static_and_class_methods():
+    class Tagged(Model):
+        tag: str
+
+        def validate_tag(self, tag):
+            if self.is_empty(tag) or tag in self.reserved_tags():
+                raise ValidationError()
+            return tag
+
+        @classmethod
+        def reserved_tags(cls):
+            return {'admin'}
+
+    view = Tagged.view({'tag': 'a'})
+
+    assert view.is_empty('') is True
+    assert view.reserved_tags() == {'admin'}
+    assert view.validate() is None
+    assert Tagged.view({'tag': 'admin'}).validate(raise_exception=False) is False
+
+
+def test_model_view_validate_nested_invalid(person_data):
+    person_data['address'] = {'street': 'A'}
+    view = Person.view(person_data)
+
+    with pytest.raises(EmptyField):
+        view.validate()
+
+
+def test_model_view_as_dict_not_validated(person_data):
+    with pytest.raises(AssertionError):
+        Person.view(person_data).as_dict()
+
+
+def test_model_view_as_dict_unchanged(person_data):
+    view = Person.view(person_data)
+    view.validate()
+
+    assert view.as_dict() is person_data
+
+
+def test_model_view_as_dict_converted(person_data):
+    person_data['address']['street'] = 1
+    view = Person.view(person_data)
+    view.validate()
+
+    as_dict = view.as_dict()
+
+    assert as_dict is not person_data
+    assert as_dict == {'name': 'John', 'age': 18, 'address': {'city': 'Recife', 'street': '1'}, 'tags': ['a']}
+
+
+def test_model_view_as_dict_missing_fields():
+    view = Person.view({'name': 'John', 'age': 18})
+    view.validate()
+
+    assert view.as_dict() == {'name': 'John', 'age': 18, 'address': None, 'tags': []}
+
+
+def test_model_view_property():
+    class Rectangle(Model):
+        width: float
+        height: float
+        area: float
+
+        @property
+        def area(self):
+            return self.width * self.height
+
+    view = Rectangle.view({'width': 2, 'height': '3'})
+
+    assert view.area == 6
+
+
+def test_model_view_property_not_field():
+    class Square(Model):
+        side: float
+
+        @property
+        def area(self):
+            return self.side ** 2
+
+        def describe(self):
+            return 'area {}'.format(self.area)
+
+    view = Square.view({'side': '2'})
+
+    assert 'area' not in Square._meta.fields
+    assert view.area == 4
+    assert view.describe() == 'area 4.0'